@@ -116,11 +116,21 @@ LOGGING_CONFIG: Dict[str, Any] = {
 }
 
 
+# Tracking if the logging configuration has been applied
+_configured: bool = False
+
+
 # Setup the logging configuration
 def setup():
+    global _configured
+
+    # dictConfig clears the cache of every known logger, only apply it once
+    if _configured:
+        return
 
     # Setting up the configureation
     logging.config.dictConfig(LOGGING_CONFIG)
+    _configured = True
 
 
 # Add the identifier filter
@@ -19,7 +19,7 @@ class NodePubTable(DataClassJsonMixin):
 @dataclass
 class NodeDiagnostics(DataClassJsonMixin):
     timestamp: str = field(
-        default_factory=lambda: str(datetime.datetime.now().isoformat())
+        default_factory=lambda: datetime.datetime.now().isoformat()
     )  # ISO str
     latency: float = 0  # ms
     payload_size: float = 0  # KB
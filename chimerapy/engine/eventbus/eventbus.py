@@ -10,6 +10,7 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
     Literal,
     Optional,
     Type,
@@ -72,6 +73,9 @@ class EventBus(AsyncObservable):
         subscription = await self.stream.subscribe_async(observer)
         self.subscription_map[observer] = subscription
 
+    async def asubscribe_many(self, observers: Iterable[AsyncObserver]):
+        await asyncio.gather(*[self.asubscribe(ob) for ob in observers])
+
     async def aunsubscribe(self, observer: AsyncObserver):
         if observer not in self.subscription_map:
             raise RuntimeError(
@@ -115,6 +119,23 @@ class EventBus(AsyncObservable):
             loop.create_task(wrapper)
             return future
 
+    def subscribe_many(self, observers: Iterable[AsyncObserver]) -> Future:
+        if isinstance(self.thread, AsyncLoopThread):
+            return self.thread.exec(self.asubscribe_many(observers))
+        else:
+            loop = asyncio.get_event_loop()
+            wrapper, future = future_wrapper(self.asubscribe_many(observers))
+            loop.create_task(wrapper)
+            return future
+
+
+# How the callback of a TypedObserver receives the event, per ``handle_event``
+_EVENT_HANDLERS: Dict[str, Callable[[Callable, Event], Any]] = {
+    "pass": lambda func, event: func(event),
+    "unpack": lambda func, event: func(**event.data.__dict__),
+    "drop": lambda func, event: func(),
+}
+
 
 class TypedObserver(AsyncObserver, Generic[T]):
     def __init__(
@@ -131,10 +152,12 @@ class TypedObserver(AsyncObserver, Generic[T]):
         self.event_type = event_type
         self.event_data_cls = event_data_cls
         self.handle_event = handle_event
+        self._invoke = _EVENT_HANDLERS.get(handle_event)
         self.received: deque[str] = deque(maxlen=10)
 
         # Callables
         self._on_asend = on_asend
+        self._asend_is_coro = asyncio.iscoroutinefunction(on_asend)
         self._on_athrow = on_athrow
         self._on_aclose = on_aclose
 
@@ -145,6 +168,7 @@ class TypedObserver(AsyncObserver, Generic[T]):
 
     def bind_asend(self, func: Callable[[Event], Awaitable[None]]):
         self._on_asend = func
+        self._asend_is_coro = asyncio.iscoroutinefunction(func)
 
     def bind_athrow(self, func: Callable[[Exception], Awaitable[None]]):
         self._on_athrow = func
@@ -160,24 +184,22 @@ class TypedObserver(AsyncObserver, Generic[T]):
 
     async def asend(self, event: Event):
 
-        if self.event_data_cls is None:
-            is_match = event.type == self.event_type
-        else:
-            is_match = (
-                isinstance(event.data, self.event_data_cls)
-                and event.type == self.event_type
-            )
-
-        if is_match:
-            # logger.debug(f"{self}: asend!")
-            self.received.append(event.id)
-            if self._on_asend:
-                if self.handle_event == "pass":
-                    await self.exec_callable(self._on_asend, event)
-                elif self.handle_event == "unpack":
-                    await self.exec_callable(self._on_asend, **event.data.__dict__)
-                elif self.handle_event == "drop":
-                    await self.exec_callable(self._on_asend)
+        # Every observer sees every event, so reject on the cheap type check first
+        if event.type != self.event_type:
+            return
+        if self.event_data_cls is not None and not isinstance(
+            event.data, self.event_data_cls
+        ):
+            return
+
+        # logger.debug(f"{self}: asend!")
+        self.received.append(event.id)
+        if not self._on_asend or not self._invoke:
+            return
+
+        output = self._invoke(self._on_asend, event)
+        if self._asend_is_coro:
+            await output
 
     async def athrow(self, ex: Exception):
         if self._on_athrow:
@@ -11,6 +11,14 @@ T = TypeVar("T")
 # Global variables
 global_event_bus: Optional["EventBus"] = None
 
+_MISSING = object()
+_SCALARS = (str, int, float, bool, bytes)
+
+
+def _unchanged(old: Any, new: Any) -> bool:
+    # Only compare cheap immutable values, containers could be mutated in-place
+    return type(old) is type(new) and isinstance(new, _SCALARS) and old == new
+
 
 @dataclass
 class DataClassEvent:
@@ -40,6 +48,10 @@ def evented(cls):
             return self.__dict__[f"_{name}"]
 
         def setter(self, value):
+            # Avoid emitting events for assignments that change nothing
+            if _unchanged(self.__dict__.get(f"_{name}", _MISSING), value):
+                return
+
             self.__dict__[f"_{name}"] = value
             if self.event_bus:
                 event_name = f"{cls.__name__}.changed"
@@ -87,6 +99,10 @@ def make_evented(
             return self.__evented_values.get(name)
 
         def setter(self, value):
+            # Avoid emitting events for assignments that change nothing
+            if _unchanged(self.__evented_values.get(name, _MISSING), value):
+                return
+
             self.__evented_values[name] = value
             if object:
                 event_data = DataClassEvent(object)
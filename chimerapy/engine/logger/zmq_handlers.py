@@ -1,11 +1,14 @@
 import atexit
 import logging
 import os
+import queue
 import threading
 from logging import LogRecord, makeLogRecord
 from logging.handlers import QueueHandler
-from typing import Any, Callable, Collection, Dict, Optional
+from typing import Any, Callable, Collection, Dict, List, Optional
 
+import multiprocess.util
+import orjson
 import zmq
 
 from .common import HandlerFactory
@@ -54,19 +57,34 @@ class ZMQPullListener(threading.Thread):
 
     def run(self) -> None:
         """Run the LogsListener thread."""
+        # Block on the socket (bounded, to notice ``stop``) instead of spinning
+        poller = zmq.Poller()
+        poller.register(self.queue, zmq.POLLIN)
+
         while self.running.is_set():
+            if not poller.poll(timeout=100):
+                continue
+
             try:
-                logobj = self.queue.recv_json(zmq.NOBLOCK)
+                # Push handlers encode with orjson, so decode with it as well
+                logobj = orjson.loads(self.queue.recv(zmq.NOBLOCK))
 
                 if "msg" in logobj and logobj["msg"] == "STOP":
                     break
 
-                record = makeLogRecord(logobj)
+                # Push handlers send their records in batches
+                logobjs = logobj if isinstance(logobj, list) else [logobj]
+
+                for obj in logobjs:
+                    record = makeLogRecord(obj)
 
-                for handler in self.handlers:
-                    if self.respect_handler_level and record.levelno < handler.level:
-                        continue
-                    handler.handle(record)
+                    for handler in self.handlers:
+                        if (
+                            self.respect_handler_level
+                            and record.levelno < handler.level
+                        ):
+                            continue
+                        handler.handle(record)
 
             except zmq.Again:
                 continue
@@ -113,14 +131,94 @@ class NodeIDZMQPullListener(ZMQPullListener):
 
 
 class ZMQPushHandler(QueueHandler):
-    """A handler that sends log messages to a ZMQ PUSH socket."""
+    """A handler that sends log messages to a ZMQ PUSH socket.
+
+    Records are buffered and sent in batches by a background thread, instead of \
+    one socket send per record.
+
+    Args:
+        host (str): The host of the PULL socket.
+        port (int): The port of the PULL socket.
+        batch_size (int, optional): The maximum number of records per message.
+        flush_interval (float, optional): How long (in seconds) the sender thread \
+            waits for new records before checking if it should stop.
+    """
 
-    def __init__(self, host: str, port: int):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        batch_size: int = 64,
+        flush_interval: float = 0.05,
+    ):
         socket = connect_push_socket(host, port)
         super().__init__(socket)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # Buffer of prepared records, drained by the sender thread
+        self._buffer: queue.SimpleQueue = queue.SimpleQueue()
+        self._send_lock = threading.Lock()
+        # Not ``_closed``, which logging.Handler.close sets to True
+        self._stopped = threading.Event()
+        self._sender = threading.Thread(target=self._send_batches, daemon=True)
+        self._sender.start()
+
+        # Make sure buffered records are sent when the (sub)process exits, Nodes
+        # run under ``multiprocess``, whose workers skip ``atexit``
+        atexit.register(self.close)
+        multiprocess.util.Finalize(None, self.close, exitpriority=10)
 
     def emit(self, record: LogRecord) -> None:
-        self.queue.send_json(record.__dict__)  # type: ignore[union-attr]
+        try:
+            # Format msg (and any traceback) now, args and exc_info can't be sent
+            self._buffer.put(self.prepare(record).__dict__)
+        except Exception:
+            self.handleError(record)
+
+    def _drain(self, n: int) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        while len(batch) < n:
+            try:
+                batch.append(self._buffer.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _send(self, batch: List[Dict[str, Any]]) -> None:
+        if batch:
+            with self._send_lock:
+                self.queue.send(orjson.dumps(batch, default=str))  # type: ignore
+
+    def _send_batches(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                logobj = self._buffer.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            self._send([logobj] + self._drain(self.batch_size - 1))
+
+    def flush(self) -> None:
+        """Send all the buffered records from the calling thread."""
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                break
+            self._send(batch)
+
+    def close(self) -> None:
+        if self._stopped.is_set():
+            return
+
+        self._stopped.set()
+        self._sender.join(timeout=1)
+        self.flush()
+
+        # Give the socket a bounded time to deliver the last batches
+        socket: zmq.Socket = self.queue  # type: ignore[assignment]
+        socket.close(linger=1000)
+        socket.context.term()
+        super().close()
 
 
 class NodeIdZMQPushHandler(ZMQPushHandler):
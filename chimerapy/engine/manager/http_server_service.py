@@ -1,7 +1,8 @@
 import traceback
 from concurrent.futures import Future
-from typing import Dict, List
+from typing import Any, Dict, List
 
+import orjson
 from aiohttp import web
 
 from chimerapy.engine import _logger, config
@@ -142,8 +143,12 @@ class HttpServerService(Service):
     ## Worker -> Manager Routes
     #####################################################################################
 
+    async def _read_json(self, request: web.Request) -> Any:
+        # Parse with orjson, as the Worker's server does
+        return orjson.loads(await request.read())
+
     async def _register_worker_route(self, request: web.Request):
-        msg = await request.json()
+        msg = await self._read_json(request)
         worker_state = WorkerState.from_dict(msg)
 
         # Register worker
@@ -164,7 +169,7 @@ class HttpServerService(Service):
         return web.json_response(response)
 
     async def _deregister_worker_route(self, request: web.Request):
-        msg = await request.json()
+        msg = await self._read_json(request)
         worker_state = WorkerState.from_dict(msg)
 
         # Deregister worker
@@ -175,8 +180,8 @@ class HttpServerService(Service):
         return web.HTTPOk()
 
     async def _update_nodes_status(self, request: web.Request):
-        msg = await request.json()
-        worker_state = WorkerState.from_dict(msg)
+        msg = await self._read_json(request)
+        worker_state = WorkerState.from_dict_fast(msg)
 
         # Updating nodes status
         if worker_state.id in self.state.workers:
@@ -187,7 +192,7 @@ class HttpServerService(Service):
         return web.HTTPOk()
 
     async def _update_send_archive(self, request: web.Request):
-        msg = await request.json()
+        msg = await self._read_json(request)
         event_data = UpdateSendArchiveEvent(**msg)
         await self.eventbus.asend(Event("update_send_archive", event_data))
         return web.HTTPOk()
@@ -1,6 +1,10 @@
+import asyncio
 import datetime
-import json
-from typing import Dict, Optional
+import os
+import pathlib
+from typing import Any, Dict, Optional
+
+import orjson
 
 from ..eventbus import EventBus, TypedObserver
 from ..service import Service
@@ -25,6 +29,12 @@ class SessionRecordService(Service):
         self.stop_time: Optional[datetime.datetime] = None
         self.duration: float = 0
 
+        # Last written meta record, to avoid rewriting an unchanged file
+        self._last_meta: Optional[Dict[str, Any]] = None
+
+        # Overlapping saves would share the temporary meta file
+        self._save_lock = asyncio.Lock()
+
     async def async_init(self):
 
         # Specify observers
@@ -42,7 +52,7 @@ class SessionRecordService(Service):
         for ob in self.observers.values():
             await self.eventbus.asubscribe(ob)
 
-    def _save_meta(self):
+    async def _save_meta(self):
         # Get the times, handle Optional
         if self.start_time:
             start_time = self.start_time.strftime("%Y_%m_%d_%H_%M_%S.%f%z")
@@ -64,15 +74,34 @@ class SessionRecordService(Service):
             "stop_time": stop_time,
         }
 
-        with open(self.state.logdir / "meta.json", "w") as f:
-            json.dump(meta, f, indent=2)
+        async with self._save_lock:
+
+            # Skip the write if nothing has changed since the last one
+            meta_file = self.state.logdir / "meta.json"
+            if meta == self._last_meta and meta_file.exists():
+                return
+
+            # Write off the event loop, the Manager keeps serving requests meanwhile
+            data = orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_meta, meta_file, data)
+            self._last_meta = meta
+
+    @staticmethod
+    def _write_meta(meta_file: pathlib.Path, data: bytes):
+
+        # Replace atomically, so readers never see a partially written file
+        tmp_file = meta_file.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, meta_file)
 
     def start_recording(self):
 
         # Mark the start time
         self.start_time = datetime.datetime.now()
 
-    def stop_recording(self):
+    async def stop_recording(self):
 
         # Mark the stop time
         self.stop_time = datetime.datetime.now()
@@ -83,4 +112,4 @@ class SessionRecordService(Service):
             self.duration = 0
 
         # Save the data
-        self._save_meta()
+        await self._save_meta()
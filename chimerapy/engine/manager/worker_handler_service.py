@@ -11,6 +11,7 @@ from typing import Any, Coroutine, Dict, List, Literal, Optional, Union
 import aiohttp
 import dill
 import networkx as nx
+import orjson
 
 from chimerapy.engine import _logger, config
 
@@ -51,7 +52,9 @@ class WorkerHandlerService(Service):
         self.commitable_graph: bool = False
         self.node_pub_table = NodePubTable()
         self.collected_workers: Dict[str, bool] = {}
-        self.http_client = aiohttp.ClientSession()
+        self.http_client = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64)
+        )
 
         # Also create a tempfolder to store any miscellaneous files and folders
         self.tempfolder = pathlib.Path(tempfile.mkdtemp())
@@ -127,8 +130,10 @@ class WorkerHandlerService(Service):
         )
         self.state.workers[worker_state.id] = evented_worker_state
         logger.debug(
-            f"Manager registered <Worker id={worker_state.id}"
-            f" name={worker_state.name}> from {worker_state.ip}"
+            "Manager registered <Worker id=%s name=%s> from %s",
+            worker_state.id,
+            worker_state.name,
+            worker_state.ip,
         )
 
         # Register entity from logging
@@ -362,7 +367,8 @@ class WorkerHandlerService(Service):
                 out_bound=list(self.graph.G.successors(node_id)),
                 follow=self.graph.G.nodes[node_id]["follow"],
                 context=context,
-            )
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
         )
 
         # Construct the url
@@ -494,26 +500,25 @@ class WorkerHandlerService(Service):
         if not self.state.workers:
             return True
 
-        # Create a new session for the moment
+        # Encode once and let the session enforce the timeout per request
+        payload = json.dumps(data)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        async def _request(url: str) -> aiohttp.ClientResponse:
+            async with self.http_client.request(
+                htype, url, data=payload, timeout=client_timeout
+            ) as resp:
+                return resp
+
+        # Reuse the persistent session for the fan-out
         tasks: List[asyncio.Task] = []
         for worker_data in self.state.workers.values():
             url = f"http://{worker_data.ip}:{worker_data.port}" + route
-            if htype == "get":
-                tasks.append(
-                    asyncio.create_task(
-                        self.http_client.get(url, data=json.dumps(data))
-                    )
-                )
-            elif htype == "post":
-                tasks.append(
-                    asyncio.create_task(
-                        self.http_client.post(url, data=json.dumps(data))
-                    )
-                )
+            tasks.append(asyncio.create_task(_request(url)))
 
-        # Wait with a timeout
+        # Wait until all the requests complete or time out
         try:
-            await asyncio.wait(tasks, timeout=timeout)
+            await asyncio.wait(tasks)
         except Exception:
 
             # Disregard certain exceptions
@@ -716,29 +721,36 @@ class WorkerHandlerService(Service):
 
         return False
 
-    async def gather(self) -> Dict:
-        # Wail until all workers have responded with their node server data
-        gather_data = {}
-        for worker_id in self.state.workers:
+    async def _single_worker_gather(self, worker_id: str) -> Dict:
 
-            async with self.http_client.get(
-                f"{self._get_worker_ip(worker_id)}/nodes/gather",
-                timeout=config.get("manager.timeout.info-request"),
-            ) as resp:
-                if resp.ok:
+        async with self.http_client.get(
+            f"{self._get_worker_ip(worker_id)}/nodes/gather",
+            timeout=config.get("manager.timeout.info-request"),
+        ) as resp:
+            if not resp.ok:
+                logger.error(f"{self}: Gathering Worker {worker_id}: FAILED")
+                return {}
 
-                    # Read the content
-                    content = await resp.content.read()
+            # Read the content
+            content = await resp.content.read()
 
-                    # Saving the data
-                    data = pickle.loads(content)["node_data"]
-                    for node_id, node_data in data.items():
-                        data[node_id] = DataChunk.from_json(node_data)
+        # Saving the data
+        data = pickle.loads(content)["node_data"]
+        for node_id, node_data in data.items():
+            data[node_id] = DataChunk.from_json(node_data)
 
-                    gather_data.update(data)
+        return data
 
-                else:
-                    logger.error(f"{self}: Gathering Worker {worker_id}: FAILED")
+    async def gather(self) -> Dict:
+        # Wail until all workers have responded with their node server data,
+        # requesting from all of them at once
+        results = await asyncio.gather(
+            *[self._single_worker_gather(worker_id) for worker_id in self.state.workers]
+        )
+
+        gather_data = {}
+        for data in results:
+            gather_data.update(data)
 
         return gather_data
 
@@ -783,7 +795,7 @@ class WorkerHandlerService(Service):
 
         async with self.http_client.post(
             f"{self._get_worker_ip(worker_id)}/nodes/registered_methods",
-            data=json.dumps(data),
+            data=orjson.dumps(data),
         ) as resp:
 
             if resp.ok:
@@ -791,7 +803,7 @@ class WorkerHandlerService(Service):
                 return resp_data
             else:
                 logger.debug(
-                    f"{self}: Registered Method for Worker {worker_id}: FAILED"
+                    "%s: Registered Method for Worker %s: FAILED", self, worker_id
                 )
                 return {"success": False, "output": None}
 
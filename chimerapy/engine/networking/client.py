@@ -22,7 +22,7 @@ import asyncio_atexit
 # Logging
 from chimerapy.engine import _logger, config
 
-from ..utils import async_waiting_for, create_payload
+from ..utils import create_payload, decode_payload, encode_payload
 from .async_loop_thread import AsyncLoopThread
 from .enums import GENERAL_MESSAGE
 
@@ -62,6 +62,7 @@ class Client:
         self.running.clear()
         self.msg_processed_counter = 0
         self.uuid_records: collections.deque[str] = collections.deque(maxlen=100)
+        self._ok_waiters: Dict[str, asyncio.Future] = {}
         self.tasks: List[asyncio.Task] = []
 
         # Adding default client handlers
@@ -106,7 +107,28 @@ class Client:
 
     async def _ok(self, msg: Dict):
         # self.logger.debug(f"{self}: received OK")
-        self.uuid_records.append(msg["data"]["uuid"])
+        msg_uuid = msg["data"]["uuid"]
+        self.uuid_records.append(msg_uuid)
+
+        waiter = self._ok_waiters.pop(msg_uuid, None)
+        if waiter and not waiter.done():
+            waiter.set_result(True)
+
+    async def _wait_ok(self, msg_uuid: str) -> bool:
+
+        # The OK could have arrived while sending
+        if msg_uuid in self.uuid_records:
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._ok_waiters[msg_uuid] = waiter
+        try:
+            await asyncio.wait_for(waiter, timeout=config.get("comms.timeout.ok"))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._ok_waiters.pop(msg_uuid, None)
 
     ####################################################################
     # IO Main Methods
@@ -123,7 +145,7 @@ class Client:
             self.msg_processed_counter += 1
 
             # Extract the binary data and decoded it
-            msg = aiohttp_msg.json()
+            msg = decode_payload(aiohttp_msg.data)
 
             # Select the handler
             handler = self.ws_handlers[msg["signal"]]
@@ -132,8 +154,10 @@ class Client:
             # Send OK if requested
             if msg["ok"]:
                 try:
-                    await self._ws.send_json(
-                        create_payload(GENERAL_MESSAGE.OK, {"uuid": msg["uuid"]})
+                    await self._ws.send_str(
+                        encode_payload(
+                            create_payload(GENERAL_MESSAGE.OK, {"uuid": msg["uuid"]})
+                        )
                     )
                 except ConnectionResetError:
                     # self.logger.warning(
@@ -160,7 +184,7 @@ class Client:
 
         # Send the message
         try:
-            await self._ws.send_json(payload)
+            await self._ws.send_str(encode_payload(payload))
         except ConnectionResetError:
             # self.logger.warning(f"{self}: ConnectionResetError, shutting down ws")
             await self._ws.close()
@@ -168,11 +192,7 @@ class Client:
 
         # If ok, wait until ok
         if ok:
-
-            await async_waiting_for(
-                lambda: msg_uuid in self.uuid_records,
-                timeout=config.get("comms.timeout.ok"),
-            )
+            await self._wait_ok(msg_uuid)
 
     async def _register(self):
 
@@ -237,7 +257,7 @@ class Client:
 
     async def async_send_folder(self, sender_id: str, dir: pathlib.Path) -> bool:
 
-        if not dir.is_dir() and not dir.exists():
+        if not dir.is_dir():
             self.logger.error(f"Cannot send non-existent dir: {dir}.")
             return False
 
@@ -273,10 +293,7 @@ class Client:
 
         if ok:
 
-            success = await async_waiting_for(
-                lambda: msg_uuid in self.uuid_records,
-                timeout=config.get("comms.timeout.ok"),
-            )
+            success = await self._wait_ok(msg_uuid)
             if not success:
                 self.logger.warning(f"{self}: Timeout in OK")
 
@@ -296,9 +313,7 @@ class Client:
 
     def send_folder(self, sender_id: str, dir: pathlib.Path) -> Future[bool]:
 
-        assert (
-            dir.is_dir() and dir.exists()
-        ), f"Sending {dir} needs to be a folder that exists."
+        assert dir.is_dir(), f"Sending {dir} needs to be a folder that exists."
 
         return self._exec_coro(self.async_send_folder(sender_id, dir))
 
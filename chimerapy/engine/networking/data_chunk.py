@@ -25,18 +25,6 @@ class DataChunk:
         # Storage
         self._container = collections.defaultdict(dict)
 
-        # Creating mapping from content_type and compression method
-        self._content_type_2_serial_mapping = {
-            "image": (self._serialize_image, self._deserialize_image),
-            "images": (self._serialize_images, self._deserialize_images),
-        }
-
-        # Creating mapping for checking content_type
-        self._content_type_2_checks_mapping = {
-            "image": self._check_image,
-            "images": self._check_images,
-        }
-
         # Adding default key-value pair
         self._container["meta"] = {
             "value": {
@@ -113,6 +101,17 @@ class DataChunk:
     def _deserialize_images(self, images_bytes: List[bytes]):
         return [self._deserialize_image(image_bytes) for image_bytes in images_bytes]
 
+    # Mapping from content_type to (de)serialization and checks, built once
+    # for the class instead of re-binding the methods for every DataChunk
+    _content_type_2_serial_mapping = {
+        "image": (_serialize_image, _deserialize_image),
+        "images": (_serialize_images, _deserialize_images),
+    }
+    _content_type_2_checks_mapping = {
+        "image": _check_image,
+        "images": _check_images,
+    }
+
     ####################################################################
     # (De)Serialization
     ####################################################################
@@ -129,7 +128,7 @@ class DataChunk:
             # are needed
             if record["content-type"] not in ["other", "meta"]:
                 s_func = self._content_type_2_serial_mapping[record["content-type"]][0]
-                value = s_func(record["value"])
+                value = s_func(self, record["value"])
             else:
                 value = record["value"]
 
@@ -152,7 +151,7 @@ class DataChunk:
             # are needed
             if record["content-type"] not in ["other", "meta"]:
                 ds_func = self._content_type_2_serial_mapping[record["content-type"]][1]
-                value = ds_func(record["value"])
+                value = ds_func(self, record["value"])
             else:
                 value = record["value"]
 
@@ -206,7 +205,7 @@ class DataChunk:
         # Get the check function (only on specify types of content
         if content_type in ["image"]:
             check_func = self._content_type_2_checks_mapping[content_type]
-            check_func(value)
+            check_func(self, value)
 
         # Add an entry
         self._container[name] = {"value": value, "content-type": content_type}
@@ -236,9 +235,4 @@ class DataChunk:
         self._container[name] = record
 
     def contains(self) -> List[str]:
-        keys = []
-        for key in self._container:
-            if key != "meta":
-                keys.append(key)
-
-        return keys
+        return [key for key in self._container if key != "meta"]
@@ -24,8 +24,9 @@ from tqdm import tqdm
 # Logging
 from chimerapy.engine import _logger, config
 from chimerapy.engine.utils import (
-    async_waiting_for,
     create_payload,
+    decode_payload,
+    encode_payload,
     get_ip_address,
 )
 
@@ -102,6 +103,9 @@ class Server:
         # Creating container for ws clients
         self.ws_clients: Dict[str, web.WebSocketResponse] = {}
 
+        # Pending OK acknowledgements, resolved as they arrive
+        self._ok_waiters: Dict[str, asyncio.Future] = {}
+
         # Adding unique routes
         if self.routes:
             self._app.add_routes(self.routes)
@@ -215,7 +219,7 @@ class Server:
         # You cannot rely on Content-Length if transfer is chunked.
         read = 0
         total_size = meta["size"]
-        prev_n = 0
+        prev_n = 0.0
 
         # Reading the buffer and writing the file
         async with aiofiles.open(location, "wb") as f:
@@ -226,6 +230,8 @@ class Server:
                 unit_scale=True,
                 desc=f"File {field.filename}",
                 # file=tqdm_out,
+                disable=None,  # No bar when stderr is not a TTY (i.e. logs)
+                mininterval=0.5,
             ) as pbar:
                 while True:
                     chunk = await field.read_chunk(8192 * 10)  # 8192 bytes by default.
@@ -233,9 +239,16 @@ class Server:
                         break
                     await f.write(chunk)
                     read += len(chunk)
-                    pbar.update(len(chunk) / total_size)
-                    if (pbar.n - prev_n) > 0.05:
-                        prev_n = pbar.n
+
+                    # Only redraw the bar every 5%, instead of for every chunk
+                    progress = read / total_size
+                    if (progress - prev_n) > 0.05:
+                        pbar.update(progress - prev_n)
+                        prev_n = progress
+
+                # Account for the remainder since the last redraw
+                if read:
+                    pbar.update(read / total_size - prev_n)
 
         # After finishing, mark the size and that is complete
         self.file_transfer_records.records[id].size = total_size
@@ -248,7 +261,12 @@ class Server:
     ####################################################################
 
     async def _ok(self, msg: Dict, ws: web.WebSocketResponse):
-        self.uuid_records.append(msg["data"]["uuid"])
+        msg_uuid = msg["data"]["uuid"]
+        self.uuid_records.append(msg_uuid)
+
+        waiter = self._ok_waiters.pop(msg_uuid, None)
+        if waiter and not waiter.done():
+            waiter.set_result(True)
 
     async def _register_ws_client(self, msg: Dict, ws: web.WebSocketResponse):
         # self.logger.debug(f"{self}: reigstered client: {msg['data']['client_id']}")
@@ -283,7 +301,7 @@ class Server:
                 self.msg_processed_counter += 1
 
                 # Extract the binary data and decoded it
-                msg = aiohttp_msg.json()
+                msg = decode_payload(aiohttp_msg.data)
 
                 # Select the handler
                 handler = self.ws_handlers[msg["signal"]]
@@ -295,8 +313,12 @@ class Server:
                 if msg["ok"]:
                     try:
                         # self.logger.debug(f"{self}: sending OK")
-                        await ws.send_json(
-                            create_payload(GENERAL_MESSAGE.OK, {"uuid": msg["uuid"]})
+                        await ws.send_str(
+                            encode_payload(
+                                create_payload(
+                                    GENERAL_MESSAGE.OK, {"uuid": msg["uuid"]}
+                                )
+                            )
                         )
                     except ConnectionResetError:
                         self.logger.warning(
@@ -346,23 +368,50 @@ class Server:
         payload = create_payload(signal=signal, data=data, msg_uuid=msg_uuid, ok=ok)
 
         # Send the message
+        if not await self._send_str(ws, client_id, encode_payload(payload)):
+            return False
+
+        # If ok, wait until ok
+        if ok:
+            await self._wait_ok(msg_uuid)
+
+        return True
+
+    async def _send_str(
+        self, ws: web.WebSocketResponse, client_id: str, payload: str
+    ) -> bool:
+
+        # First, check if the ws is still open
+        if ws.closed:
+            self.ws_clients.pop(client_id, None)
+            return True
+
         try:
-            await ws.send_json(payload)
+            await ws.send_str(payload)
         except ConnectionResetError:
             self.logger.warning(f"{self}: ConnectionResetError, shutting down ws")
             await ws.close()
-            del self.ws_clients[client_id]
+            self.ws_clients.pop(client_id, None)
             return False
 
-        # If ok, wait until ok
-        if ok:
-            await async_waiting_for(
-                lambda: msg_uuid in self.uuid_records,
-                timeout=config.get("comms.timeout.ok"),
-            )
-
         return True
 
+    async def _wait_ok(self, msg_uuid: str) -> bool:
+
+        # The OK could have arrived while sending
+        if msg_uuid in self.uuid_records:
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._ok_waiters[msg_uuid] = waiter
+        try:
+            await asyncio.wait_for(waiter, timeout=config.get("comms.timeout.ok"))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._ok_waiters.pop(msg_uuid, None)
+
     ####################################################################
     # Server ASync Lifecycle API
     ####################################################################
@@ -408,10 +457,24 @@ class Server:
 
         # Create msg container and execute writing coroutine for all
         # clients
-        msg = {"signal": signal, "data": data, "ok": ok}
         coros = []
-        for client_id in self.ws_clients:
-            coros.append(self._write_ws(client_id, msg))
+        if ok:
+            # Each client acknowledges its own message, so each needs a uuid
+            for client_id in self.ws_clients:
+                msg = {
+                    "signal": signal,
+                    "data": data,
+                    "msg_uuid": str(uuid.uuid4()),
+                    "ok": ok,
+                }
+                coros.append(self._write_ws(client_id, msg))
+        else:
+            # Otherwise, it is the same message for all: serialize it only once
+            payload = encode_payload(
+                create_payload(signal=signal, data=data, msg_uuid=str(uuid.uuid4()))
+            )
+            for client_id, ws in list(self.ws_clients.items()):
+                coros.append(self._send_str(ws, client_id, payload))
 
         # Wait until all complete
         try:
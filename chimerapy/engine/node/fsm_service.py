@@ -3,7 +3,7 @@ from typing import Dict
 
 from ..eventbus import EventBus, TypedObserver
 from ..service import Service
-from ..states import NodeState
+from ..states import NodeFSM, NodeState
 
 
 class FSMService(Service):
@@ -46,25 +46,25 @@ class FSMService(Service):
             await self.eventbus.asubscribe(ob)
 
     async def init(self):
-        self.state.fsm = "INITIALIZED"
+        self.state.fsm = NodeFSM.INITIALIZED
 
     async def setup(self):
-        self.state.fsm = "READY"
+        self.state.fsm = NodeFSM.READY
 
     async def setup_connections(self):
-        self.state.fsm = "CONNECTED"
+        self.state.fsm = NodeFSM.CONNECTED
 
     async def start(self):
-        self.state.fsm = "PREVIEWING"
+        self.state.fsm = NodeFSM.PREVIEWING
 
     async def record(self):
-        self.state.fsm = "RECORDING"
+        self.state.fsm = NodeFSM.RECORDING
 
     async def stop(self):
-        self.state.fsm = "STOPPED"
+        self.state.fsm = NodeFSM.STOPPED
 
     async def collect(self):
-        self.state.fsm = "SAVED"
+        self.state.fsm = NodeFSM.SAVED
 
     async def teardown(self):
-        self.state.fsm = "SHUTDOWN"
+        self.state.fsm = NodeFSM.SHUTDOWN
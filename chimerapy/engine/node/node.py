@@ -622,7 +622,7 @@ class Node:
         self.logger.setLevel(self.logging_level)
 
         # Saving synchronized variable
-        if type(running) != type(None):
+        if running is not None:
             self._running = running
 
         # Start an async loop
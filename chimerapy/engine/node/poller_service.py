@@ -29,6 +29,7 @@ class PollerService(Service):
         self.in_bound: List[str] = in_bound
         self.in_bound_by_name: List[str] = in_bound_by_name
         self.follow: Optional[str] = follow
+        self.nicknames: Dict[str, str] = dict(zip(in_bound, in_bound_by_name))
         self.state = state
         self.eventbus = eventbus
 
@@ -97,19 +98,18 @@ class PollerService(Service):
 
         # Default value
         follow_event = False
+        received = datetime.datetime.now()
 
         # Convert the data to DataChunk
         for k, d in datas.items():
 
             # Reconstruct the DataChunk and marked when it was received
+            # (``get`` returns the stored record, so it is updated in place)
             data_chunk = DataChunk.from_bytes(d)
-            meta = data_chunk.get("meta")
-            meta["value"]["received"] = datetime.datetime.now()
-            data_chunk.update("meta", meta)
+            data_chunk.get("meta")["value"]["received"] = received
 
             # Update the latest value
-            nickname = self.in_bound_by_name[self.in_bound.index(k)]
-            self.in_bound_data[nickname] = data_chunk
+            self.in_bound_data[self.nicknames[k]] = data_chunk
 
             # Update flag if new values are coming from the node that is
             # being followed
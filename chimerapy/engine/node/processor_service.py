@@ -187,12 +187,6 @@ class ProcessorService(Service):
 
         # First check if the request is valid
         if method_name not in self.registered_methods:
-            results = {
-                "node_id": self.state.id,
-                "node_state": self.state.to_json(),
-                "success": False,
-                "output": None,
-            }
             self.logger.warning(
                 f"{self}: Worker requested execution of registered method that doesn't "
                 f"exists: {method_name}"
@@ -265,6 +259,17 @@ class ProcessorService(Service):
 
         return output, delta
 
+    @staticmethod
+    def _has_output(output: Any) -> bool:
+
+        # Falsy outputs (``None``, ``0``, ``""``, ``[]``, ...) are skipped, but
+        # frames and arrays can't be truth-tested, so check if they are empty
+        if isinstance(getattr(output, "empty", None), bool):
+            return not output.empty
+        elif getattr(output, "ndim", 0):
+            return output.size > 0
+        return bool(output)
+
     async def safe_step(self, data_chunks: Dict[str, DataChunk] = {}):
 
         # Default value
@@ -281,7 +286,7 @@ class ProcessorService(Service):
                     output, delta = await self.safe_exec(self.main_fn)
 
         # If output generated, send it!
-        if output:
+        if self._has_output(output):
 
             # If output is not DataChunk, just add as default
             if not isinstance(output, DataChunk):
@@ -294,10 +299,9 @@ class ProcessorService(Service):
             self.latest_data_chunk = output_data_chunk
 
             # Add timestamp and step id to the DataChunk
-            meta = output_data_chunk.get("meta")
-            meta["value"]["transmitted"] = datetime.datetime.now()
-            meta["value"]["delta"] = delta
-            output_data_chunk.update("meta", meta)
+            meta = output_data_chunk.get("meta")["value"]
+            meta["transmitted"] = datetime.datetime.now()
+            meta["delta"] = delta
 
             # Send out the output to the OutputsHandler
             event_data = NewOutBoundDataEvent(output_data_chunk)
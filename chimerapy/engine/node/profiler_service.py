@@ -1,11 +1,13 @@
+import asyncio
+import csv
 import datetime
 import logging
 import os
 import pickle
 from collections import deque
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
-import pandas as pd
+import numpy as np
 from psutil import Process
 
 from chimerapy.engine import config
@@ -33,13 +35,13 @@ class ProfilerService(Service):
         # State variables
         self._enable: bool = False
         self.process: Optional[Process] = None
-        self.deques: Dict[str, deque[float]] = {
-            "latency(ms)": deque(maxlen=config.get("diagnostics.deque-length")),
-            "payload_size(KB)": deque(maxlen=config.get("diagnostics.deque-length")),
-        }
         self.seen_uuids: deque[str] = deque(
             maxlen=config.get("diagnostics.deque-length")
         )
+
+        # Running aggregates of the current report interval
+        self.num_of_steps: int = 0
+        self.totals: Dict[str, float] = {"latency(ms)": 0.0, "payload_size(KB)": 0.0}
         self.async_timer = AsyncTimer(
             self.diagnostics_report, config.get("diagnostics.interval")
         )
@@ -49,6 +51,10 @@ class ProfilerService(Service):
         else:
             raise RuntimeError(f"{self}: logdir {self.state.logdir} not set!")
 
+        # Cached, instead of being looked up on every report
+        self._logging_enabled: bool = config.get("diagnostics.logging-enabled")
+        self._log_header: bool = not self.log_file.exists()
+
     async def async_init(self):
 
         # Add observers to profile
@@ -100,6 +106,8 @@ class ProfilerService(Service):
 
     async def setup(self):
         self.process = Process(pid=os.getpid())
+        # The first call only primes the CPU counters
+        self.process.cpu_percent()
 
     async def diagnostics_report(self):
 
@@ -109,21 +117,22 @@ class ProfilerService(Service):
         # Get the timestamp
         timestamp = datetime.datetime.now().isoformat()
 
-        # Get process-wide information
-        memory = self.process.memory_info()
-        memory_usage = memory.rss / 1024
-        cpu_usage = self.process.cpu_percent()
+        # Get process-wide information, sharing the underlying syscalls
+        with self.process.oneshot():
+            memory_usage = self.process.memory_info().rss / 1024
+            cpu_usage = self.process.cpu_percent()
 
         # Compute interval information of latency and payload size
-        num_of_steps = len(self.deques["latency(ms)"])
+        num_of_steps = self.num_of_steps
         if num_of_steps:
             # Compute values
-            mean_latency = sum(self.deques["latency(ms)"]) / num_of_steps
-            total_payload = sum(self.deques["payload_size(KB)"])
+            mean_latency = self.totals["latency(ms)"] / num_of_steps
+            total_payload = self.totals["payload_size(KB)"]
 
-            # Clear queues
-            for _deque in self.deques.values():
-                _deque.clear()
+            # Reset for the next interval
+            self.num_of_steps = 0
+            for key in self.totals:
+                self.totals[key] = 0.0
 
         else:
             mean_latency = 0
@@ -145,7 +154,7 @@ class ProfilerService(Service):
         await self.eventbus.asend(Event("diagnostics_report", event_data))
 
         # Write to a csv, if diagnostics enabled
-        if config.get("diagnostics.logging-enabled"):
+        if self._logging_enabled:
 
             # Create dictionary with units
             data = {
@@ -157,46 +166,44 @@ class ProfilerService(Service):
                 "num_of_steps(int)": num_of_steps,
             }
 
-            df = pd.Series(data).to_frame().T
+            # Keep the file I/O off the event loop
+            header, self._log_header = self._log_header, False
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._append_to_csv, data, header)
 
-            df.to_csv(
-                str(self.log_file),
-                mode="a",
-                header=not self.log_file.exists(),
-                index=False,
-            )
+    def _append_to_csv(self, data: Dict[str, Any], header: bool):
+        # A single row, so write it directly instead of through a pd.DataFrame
+        with open(self.log_file, "a", newline="") as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            if header:
+                writer.writerow(data.keys())
+            writer.writerow(data.values())
 
     async def post_step(self, data_chunk: DataChunk):
         # assert self.process
         if not self.process:
             return None
 
-        # Computing the diagnostics metrics per step
-        payload_size = 0.0
-
-        # Containers to compute metrics
-        payload_sizes: List[float] = []
-
         # Obtain the meta data of the data chunk
         meta = data_chunk.get("meta")["value"]
         self.seen_uuids.append(data_chunk._uuid)
 
         # Get the payload size (of all keys)
-        total_size = 0.0
-        for key in data_chunk.contains():
-            payload = data_chunk.get(key)["value"]
-            total_size += self.get_object_kilobytes(payload)
-        payload_sizes.append(total_size)
-
-        # After processing all data_chunk keys, get payload total
-        payload_size = sum(payload_sizes)
+        payload_size = sum(
+            self.get_object_kilobytes(data_chunk.get(key)["value"])
+            for key in data_chunk.contains()
+        )
 
         # Store results
-        self.deques["latency(ms)"].append(meta["delta"])
-        self.deques["payload_size(KB)"].append(payload_size)
+        self.num_of_steps += 1
+        self.totals["latency(ms)"] += meta["delta"]
+        self.totals["payload_size(KB)"] += payload_size
 
     def get_object_kilobytes(self, payload: Any) -> float:
-        return len(pickle.dumps(payload)) / 1024
+        # Arrays already know their size, avoid copying them through pickle
+        if isinstance(payload, np.ndarray):
+            return payload.nbytes / 1024
+        return len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)) / 1024
 
     async def teardown(self):
         await self.async_timer.stop()
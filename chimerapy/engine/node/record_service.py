@@ -2,7 +2,8 @@
 import logging
 import queue
 import threading
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Type
 
 from chimerapy.engine import _logger
 
@@ -17,12 +18,23 @@ from ..records import (
     VideoRecord,
 )
 from ..service import Service
-from ..states import NodeState
+from ..states import NodeFSM, NodeState
 
 logger = _logger.getLogger("chimerapy-engine")
 
 
 class RecordService(Service):
+
+    # Record class per dtype, shared by all instances
+    record_map: Dict[str, Type[Record]] = {
+        "video": VideoRecord,
+        "audio": AudioRecord,
+        "tabular": TabularRecord,
+        "image": ImageRecord,
+        "json": JSONRecord,
+        "text": TextRecord,
+    }
+
     def __init__(
         self,
         name: str,
@@ -37,7 +49,7 @@ class RecordService(Service):
         self.eventbus = eventbus
 
         # State variables
-        self.save_queue: queue.Queue = queue.Queue()
+        self.save_queue: queue.SimpleQueue = queue.SimpleQueue()
 
         # Saving thread state information
         self.is_running = threading.Event()
@@ -45,14 +57,6 @@ class RecordService(Service):
 
         # To keep record of entries
         self.records: Dict[str, Record] = {}
-        self.record_map = {
-            "video": VideoRecord,
-            "audio": AudioRecord,
-            "tabular": TabularRecord,
-            "image": ImageRecord,
-            "json": JSONRecord,
-            "text": TextRecord,
-        }
 
         # Making sure the attribute exists
         self._record_thread: Optional[threading.Thread] = None
@@ -98,9 +102,7 @@ class RecordService(Service):
     async def teardown(self):
 
         # First, indicate the end
-        self.is_running.clear()
-        if self._record_thread:
-            self._record_thread.join()
+        self._stop_thread()
 
         # self.logger.debug(f"{self}: shutdown")
 
@@ -110,38 +112,106 @@ class RecordService(Service):
 
     @property
     def enabled(self) -> bool:
-        return self.state.fsm == "RECORDING"
+        return self.state.fsm is NodeFSM.RECORDING
 
     def submit(self, entry: Dict):
         self.save_queue.put(entry)
 
-    def run(self):
+    def submit_many(self, entries: List[Dict]):
+        # A whole batch goes through the queue as a single item
+        if entries:
+            self.save_queue.put(list(entries))
 
-        # self.logger.debug(f"{self}: Running poll threading, {self.state.logdir}")
+    def _stop_thread(self):
+
+        if self.is_running.is_set():
+            self.is_running.clear()
+            # Wake up the saving thread, instead of waiting on a polling timeout
+            self.save_queue.put(None)
 
-        # Continue checking for messages from client until not running
-        while self.is_running.is_set() or self.save_queue.qsize() != 0:
+        if self._record_thread:
+            self._record_thread.join()
 
-            # Received data to save
+    def _drain(self, max_entries: int = 64) -> List[Dict]:
+        """Block for the first entry, then take any others already queued."""
+        try:
+            if self.is_running.is_set():
+                first = self.save_queue.get()
+            else:
+                first = self.save_queue.get_nowait()
+        except queue.Empty:
+            return []
+
+        items = [first]
+        while len(items) < max_entries:
             try:
-                # self.logger.debug(F"{self}: Checking save_queue")
-                data_entry = self.save_queue.get(timeout=1)
+                items.append(self.save_queue.get_nowait())
             except queue.Empty:
-                continue
+                break
+
+        # Flatten the batches from ``submit_many`` and drop the wake-up sentinel
+        entries: List[Dict] = []
+        for item in items:
+            if isinstance(item, list):
+                entries.extend(item)
+            elif item is not None:
+                entries.append(item)
+        return entries
 
-            # Case 1: new entry
-            if data_entry["name"] not in self.records:
-                entry_cls = self.record_map[data_entry["dtype"]]
-                entry = entry_cls(dir=self.state.logdir, name=data_entry["name"])
+    def run(self):
+
+        # self.logger.debug(f"{self}: Running poll threading, {self.state.logdir}")
 
-                # FixMe: Potential overwrite of existing entry?
-                self.records[data_entry["name"]] = entry
+        # Writers for batches that span several records, most of the writing
+        # (codecs, pandas, file IO) releases the GIL
+        with ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix=f"{self.name}-writer"
+        ) as pool:
 
-            # Case 2
-            # self.logger.debug(
-            #     f"{self}: Writing data entry for {data_entry['name']}"
-            # )
-            self.records[data_entry["name"]].write(data_entry)
+            # Continue checking for messages from client until not running
+            while True:
+
+                # Received data to save, in batches to reduce the per-entry overhead
+                # self.logger.debug(F"{self}: Checking save_queue")
+                entries = self._drain()
+
+                # Once stopped, an empty drain means the queue is exhausted
+                if not entries and not self.is_running.is_set():
+                    break
+
+                # Group the batch per record, so each one writes its entries at once
+                groups: Dict[str, List[Dict]] = {}
+                for data_entry in entries:
+                    groups.setdefault(data_entry["name"], []).append(data_entry)
+
+                writes = []
+                for name, group in groups.items():
+
+                    # Case 1: new entry
+                    record = self.records.get(name)
+                    if record is None:
+                        entry_cls = self.record_map[group[0]["dtype"]]
+                        record = entry_cls(dir=self.state.logdir, name=name)
+
+                        # FixMe: Potential overwrite of existing entry?
+                        self.records[name] = record
+
+                    writes.append((record, group))
+
+                # Case 2
+                # self.logger.debug(f"{self}: Writing data entries for {name}")
+                if len(writes) == 1:
+                    record, group = writes[0]
+                    record.write_many(group)
+                else:
+                    # Records are independent, but wait for the whole batch to
+                    # keep the order of the writes within each record
+                    futures = [
+                        pool.submit(record.write_many, group)
+                        for record, group in writes
+                    ]
+                    for future in futures:
+                        future.result()
 
         # Ensure that all entries close
         for entry in self.records.values():
@@ -153,8 +223,6 @@ class RecordService(Service):
         # self.logger.debug(f"{self}: collecting recording")
 
         # Signal to stop and save
-        self.is_running.clear()
-        if self._record_thread:
-            self._record_thread.join()
+        self._stop_thread()
 
         # self.logger.debug(f"{self}: Finish saving records")
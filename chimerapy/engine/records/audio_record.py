@@ -1,7 +1,7 @@
 # Built-in Imports
 import pathlib
 import wave
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Third-party Imports
 import pyaudio
@@ -25,7 +25,7 @@ class AudioRecord(Record):
         self.audio_file_path = self.dir / f"{self.name}.wav"
         self.audio_writer = wave.open(str(self.audio_file_path), "wb")
 
-    def write(self, data_chunk: Dict[str, Any]):
+    def _prep(self, data_chunk: Dict[str, Any]) -> bytes:
 
         # Only execute if it's the first time
         if self.first_frame:
@@ -52,14 +52,25 @@ class AudioRecord(Record):
             # Avoid rewriting the parameters
             self.first_frame = False
 
-        # Write
+        # Frames as bytes
         recorder_version = data_chunk.get("recorder_version", 1)
-        prepped_data = (
+        return (
             data_chunk["data"].tobytes()
             if recorder_version == 1
             else data_chunk["data"]
         )
-        self.audio_writer.writeframes(prepped_data)
+
+    def write(self, data_chunk: Dict[str, Any]):
+        self.audio_writer.writeframes(self._prep(data_chunk))
+
+    def write_many(self, data_chunks: List[Dict[str, Any]]):
+
+        # Join the frames into one buffer sized up-front, so the wav header
+        # is patched once per batch instead of once per chunk
+        if data_chunks:
+            self.audio_writer.writeframes(
+                b"".join([self._prep(data_chunk) for data_chunk in data_chunks])
+            )
 
     def close(self):
 
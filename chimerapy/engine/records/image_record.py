@@ -1,7 +1,8 @@
 # Built-in Imports
 import os
 import pathlib
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 # Third-party Imports
 import cv2
@@ -27,14 +28,42 @@ class ImageRecord(Record):
         os.makedirs(self.save_loc, exist_ok=True)
         self.index = 0
 
+        # Build the per-frame filepaths from a string prefix, not pathlib.Path
+        self._save_prefix = os.path.join(str(self.save_loc), "")
+
+        # PNG encoding releases the GIL, so batches are encoded concurrently
+        self._pool: Optional[ThreadPoolExecutor] = None
+
     def write(self, data_chunk: Dict[str, Any]):
 
         # Save the image
-        img_filepath = self.save_loc / f"{self.index}.png"
-        cv2.imwrite(str(img_filepath), data_chunk["data"])
+        cv2.imwrite(f"{self._save_prefix}{self.index}.png", data_chunk["data"])
 
         # Update the counter
         self.index += 1
 
+    def write_many(self, data_chunks: List[Dict[str, Any]]):
+
+        if len(data_chunks) < 2:
+            super().write_many(data_chunks)
+            return
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix=f"{self.name}-png"
+            )
+
+        # Each frame keeps its own index, whatever order they finish in
+        paths = [
+            f"{self._save_prefix}{self.index + i}.png" for i in range(len(data_chunks))
+        ]
+        frames = [data_chunk["data"] for data_chunk in data_chunks]
+        list(self._pool.map(cv2.imwrite, paths, frames))
+
+        # Update the counter
+        self.index += len(data_chunks)
+
     def close(self):
-        ...
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
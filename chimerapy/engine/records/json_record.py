@@ -1,9 +1,10 @@
 # Built-in Imports
-import json
 import pathlib
 from typing import IO, Any, Dict, Optional
 
 # Third-party Imports
+import orjson
+
 # Internal Import
 from .record import Record
 
@@ -27,16 +28,22 @@ class JSONRecord(Record):
         self.name = name
         self.jsonl_path = self.dir / f"{self.name}.jsonl"
         self.first_frame = False
-        self.file_handler: Optional[IO[str]] = None
+        self.file_handler: Optional[IO[bytes]] = None
 
     def write(self, data_chunk: Dict[str, Any]):
         if not self.first_frame:
-            self.file_handler = self.jsonl_path.open("w")
+            self.file_handler = self.jsonl_path.open("wb")
             self.first_frame = True
 
-        json_data = json.dumps(data_chunk["data"], indent=0)
+        # Single-line bytes (newline included), written in one call
+        json_data = orjson.dumps(
+            data_chunk["data"],
+            option=orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
         assert self.file_handler is not None
-        self.file_handler.write(f"{json_data}\n")
+        self.file_handler.write(json_data)
 
     def close(self):
         if self.file_handler is not None:
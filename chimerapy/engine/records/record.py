@@ -1,5 +1,5 @@
 # Built-in Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
 class Record:
@@ -23,6 +23,16 @@ class Record:
         """
         raise NotImplementedError("``write`` needs to be implemented.")
 
+    def write_many(self, data_chunks: List[Dict[str, Any]]):
+        """Write/Save a batch of changes, in order.
+
+        Concrete classes can override this to amortize the cost of a
+        write over the batch.
+
+        """
+        for data_chunk in data_chunks:
+            self.write(data_chunk)
+
     def close(self):
         """Write/Save changes and mark them as processed.
 
@@ -1,6 +1,6 @@
 # Built-in Imports
 import pathlib
-from typing import Any, Dict
+from typing import IO, Any, Dict, List, Optional
 
 # Third-party Imports
 import pandas as pd
@@ -30,25 +30,62 @@ class TabularRecord(Record):
         self.name = name
         self.tabular_file_path = self.dir / f"{self.name}.csv"
 
-    def write(self, data_chunk: Dict[str, Any]):
+        # Only append rows, the header is written once for a new file
+        self._write_header = not self.tabular_file_path.exists()
+        self.file_handler: Optional[IO[str]] = None
+
+    def _to_frame(self, data_chunk: Dict[str, Any]) -> pd.DataFrame:
 
         # Ensure that data is a pd.DataFrame
         if isinstance(data_chunk["data"], pd.DataFrame):
-            df = data_chunk["data"]
+            return data_chunk["data"]
         elif isinstance(data_chunk["data"], pd.Series):
-            df = data_chunk["data"].to_frame().T
+            return data_chunk["data"].to_frame().T
         elif isinstance(data_chunk["data"], Dict):
-            df = pd.Series(data_chunk["data"]).to_frame().T
+            return pd.DataFrame([data_chunk["data"]])
         else:
             raise RuntimeError("Invalid input data for Tabular Record.")
 
+    def _append(self, df: pd.DataFrame):
+
+        # Keep the csv open between writes, instead of reopening it per chunk
+        if self.file_handler is None:
+            self.file_handler = self.tabular_file_path.open("a", newline="")
+
         # Write to a csv
-        df.to_csv(
-            str(self.tabular_file_path),
-            mode="a",
-            header=not self.tabular_file_path.exists(),
-            index=False,
-        )
+        df.to_csv(self.file_handler, header=self._write_header, index=False)
+        self._write_header = False
+
+        # Rows reach the disk as they are written, like the per-chunk appends
+        self.file_handler.flush()
+
+    def write(self, data_chunk: Dict[str, Any]):
+        self._append(self._to_frame(data_chunk))
+
+    def write_many(self, data_chunks: List[Dict[str, Any]]):
+
+        # Rows given as dictionaries of the same keys (the common case) make a
+        # single frame, without building and concatenating one frame per row
+        rows = [data_chunk["data"] for data_chunk in data_chunks]
+        if len(rows) > 1 and all(isinstance(row, dict) for row in rows):
+            keys = list(rows[0])
+            if all(list(row) == keys for row in rows[1:]):
+                self._append(pd.DataFrame(rows))
+                return
+
+        dfs = [self._to_frame(data_chunk) for data_chunk in data_chunks]
+        if not dfs:
+            return
+
+        # Only concatenate rows of the same layout, to keep the file as-is
+        columns = dfs[0].columns
+        if len(dfs) > 1 and all(df.columns.equals(columns) for df in dfs[1:]):
+            self._append(pd.concat(dfs, ignore_index=True))
+        else:
+            for df in dfs:
+                self._append(df)
 
     def close(self):
-        ...
+        if self.file_handler is not None:
+            self.file_handler.close()
+            self.file_handler = None
@@ -11,6 +11,9 @@ import numpy as np
 # Internal Imports
 from .record import Record
 
+# Same codec for every VideoRecord, so only look it up once
+MP4V_FOURCC = cv2.VideoWriter_fourcc("m", "p", "4", "v")
+
 
 class VideoRecord(Record):
     def __init__(
@@ -33,7 +36,7 @@ class VideoRecord(Record):
         self.first_frame = True
         self.video_file_path = self.dir / f"{self.name}.mp4"
         # self.video_fourcc = cv2.VideoWriter_fourcc(*'MP4V')
-        self.video_fourcc = cv2.VideoWriter_fourcc("m", "p", "4", "v")
+        self.video_fourcc = MP4V_FOURCC
 
         # Handling unstable FPS
         self.frame_count: int = 0
@@ -44,7 +47,8 @@ class VideoRecord(Record):
         """Commit the unsaved changes to memory."""
 
         # Determine the size
-        frame = data_chunk["data"]
+        # (a single uint8 copy, reused for writing and as the padding frame)
+        frame = data_chunk["data"].astype(np.uint8)
         fps = data_chunk["fps"]
         timestamp = data_chunk["timestamp"]
         elapsed = (timestamp - self.start_time).total_seconds()
@@ -66,27 +70,28 @@ class VideoRecord(Record):
                 )
             # Write
             self.first_frame = False
-            self.video_writer.write(np.uint8(frame))
+            self.video_writer.write(frame)
 
         else:
 
             # Account for possible unstable fps
+            frame_period = 1 / fps
             delta = elapsed - (self.frame_count / fps)
 
             # Case 1: Too late (padd with previous frame to match)
-            num_missed_frames = int(delta // (1 / fps)) - 1
+            num_missed_frames = int(delta // frame_period) - 1
             if num_missed_frames > 0:
                 for i in range(num_missed_frames):
                     self.video_writer.write(self.previous_frame)
-                    self.frame_count += 1
+                self.frame_count += num_missed_frames
 
                 # Then use the latest frame
-                self.video_writer.write(np.uint8(frame))
+                self.video_writer.write(frame)
                 self.frame_count += 1
 
             # Case 2: On-time (by a certain tolerance), write
-            elif delta / (1 / fps) >= 0.9:
-                self.video_writer.write(np.uint8(frame))
+            elif delta / frame_period >= 0.9:
+                self.video_writer.write(frame)
                 self.frame_count += 1
 
             # Case 3: Too early (only update previous data)
@@ -94,7 +99,7 @@ class VideoRecord(Record):
                 pass
 
         # Update previous data
-        self.previous_frame = frame.astype(np.uint8)
+        self.previous_frame = frame
 
     def close(self):
 
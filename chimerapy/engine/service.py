@@ -1,8 +1,10 @@
-from collections import UserDict
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 class Service:
+
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -13,37 +15,68 @@ class Service:
         ...
 
 
-class ServiceGroup(UserDict):
+class ServiceGroup(Dict[str, Service]):
+    def __init__(self, *args, **kwargs):
+        # Bound methods per (method_name, order), reset when the services change
+        self._method_cache: Dict[Tuple, List[Callable]] = {}
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key: str, item: Service):
+        self._method_cache.clear()
+        super().__setitem__(key, item)
+
+    def __delitem__(self, key: str):
+        self._method_cache.clear()
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        self._method_cache.clear()
+        super().update(*args, **kwargs)
+
+    def pop(self, *args):
+        self._method_cache.clear()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._method_cache.clear()
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Service):  # type: ignore[override]
+        self._method_cache.clear()
+        return super().setdefault(key, default)
+
+    def clear(self):
+        self._method_cache.clear()
+        super().clear()
+
+    def _get_methods(
+        self, method_name: str, order: Optional[List[str]] = None
+    ) -> List[Callable]:
+
+        key = (method_name, tuple(order) if order else None)
+        funcs = self._method_cache.get(key)
+
+        if funcs is None:
+            if order:
+                services = [self[s_name] for s_name in order if s_name in self]
+            else:
+                services = list(self.values())
+            funcs = [getattr(s, method_name) for s in services]
+            self._method_cache[key] = funcs
 
-    data: Dict[str, Service]
+        return funcs
 
     def apply(self, method_name: str, order: Optional[List[str]] = None):
 
-        if order:
-            for s_name in order:
-                if s_name in self.data:
-                    s = self.data[s_name]
-                    func = getattr(s, method_name)
-                    func()
-        else:
-            for s in self.data.values():
-                func = getattr(s, method_name)
-                func()
+        for func in self._get_methods(method_name, order):
+            func()
 
     async def async_apply(
         self, method_name: str, order: Optional[List[str]] = None
     ) -> List[Any]:
 
         outputs: List[Any] = []
-        if order:
-            for s_name in order:
-                if s_name in self.data:
-                    s = self.data[s_name]
-                    func = getattr(s, method_name)
-                    outputs.append(await func())
-        else:
-            for s in self.data.values():
-                func = getattr(s, method_name)
-                outputs.append(await func())
+        for func in self._get_methods(method_name, order):
+            outputs.append(await func())
 
         return outputs
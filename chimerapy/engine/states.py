@@ -1,8 +1,9 @@
+import enum
 import pathlib
 import tempfile
 import uuid
-from dataclasses import dataclass, field
-from typing import Dict, Literal, Optional
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional, Union
 
 from dataclasses_json import DataClassJsonMixin, cfg
 
@@ -14,23 +15,34 @@ cfg.global_config.encoders[pathlib.Path] = str
 cfg.global_config.decoders[pathlib.Path] = pathlib.Path  # is this necessary?
 
 
+class NodeFSM(enum.IntEnum):
+    NULL = 0
+    INITIALIZED = 1
+    CONNECTED = 2
+    READY = 3
+    PREVIEWING = 4
+    RECORDING = 5
+    STOPPED = 6
+    SAVED = 7
+    SHUTDOWN = 8
+
+    @classmethod
+    def decode(cls, value: Union[str, int]) -> "NodeFSM":
+        return cls[value] if isinstance(value, str) else cls(value)
+
+
+# Keep the names on the wire, for the Front-End and any older Nodes
+cfg.global_config.encoders[NodeFSM] = lambda x: x.name
+cfg.global_config.decoders[NodeFSM] = NodeFSM.decode
+
+
 @dataclass
 class NodeState(DataClassJsonMixin):
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     name: str = ""
     port: int = 0
 
-    fsm: Literal[
-        "NULL",
-        "INITIALIZED",
-        "CONNECTED",
-        "READY",
-        "PREVIEWING",
-        "RECORDING",
-        "STOPPED",
-        "SAVED",
-        "SHUTDOWN",
-    ] = "NULL"
+    fsm: NodeFSM = NodeFSM.NULL
 
     registered_methods: Dict[str, RegisteredMethod] = field(default_factory=dict)
 
@@ -40,6 +52,33 @@ class NodeState(DataClassJsonMixin):
     # Profiler
     diagnostics: NodeDiagnostics = field(default_factory=NodeDiagnostics)
 
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "NodeState":
+        """Hand-written ``from_dict`` for the hot Node status updates.
+
+        Skips the generic decoding of ``dataclasses_json``, only converting the
+        fields that aren't JSON-native.
+
+        """
+        kwargs = {k: d[k] for k in _NODE_STATE_FIELDS if k in d}
+
+        if "fsm" in kwargs:
+            kwargs["fsm"] = NodeFSM.decode(kwargs["fsm"])
+        if kwargs.get("registered_methods"):
+            kwargs["registered_methods"] = {
+                k: RegisteredMethod(**v) if isinstance(v, dict) else v
+                for k, v in kwargs["registered_methods"].items()
+            }
+        if kwargs.get("logdir") is not None:
+            kwargs["logdir"] = pathlib.Path(kwargs["logdir"])
+        if isinstance(kwargs.get("diagnostics"), dict):
+            kwargs["diagnostics"] = NodeDiagnostics(**kwargs["diagnostics"])
+
+        return cls(**kwargs)
+
+
+_NODE_STATE_FIELDS = tuple(f.name for f in fields(NodeState))
+
 
 @dataclass
 class WorkerState(DataClassJsonMixin):
@@ -60,6 +99,29 @@ class WorkerState(DataClassJsonMixin):
         default_factory=lambda: pathlib.Path(tempfile.mkdtemp())
     )
 
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "WorkerState":
+        """Hand-written ``from_dict`` for the hot Worker status updates.
+
+        Decodes the nested ``NodeState`` entries with ``NodeState.from_dict_fast``
+        in a single pass over the nodes.
+
+        """
+        kwargs = {k: d[k] for k in _WORKER_STATE_FIELDS if k in d}
+
+        if kwargs.get("nodes"):
+            kwargs["nodes"] = {
+                k: NodeState.from_dict_fast(v) if isinstance(v, dict) else v
+                for k, v in kwargs["nodes"].items()
+            }
+        if kwargs.get("tempfolder") is not None:
+            kwargs["tempfolder"] = pathlib.Path(kwargs["tempfolder"])
+
+        return cls(**kwargs)
+
+
+_WORKER_STATE_FIELDS = tuple(f.name for f in fields(WorkerState))
+
 
 @dataclass
 class ManagerState(DataClassJsonMixin):
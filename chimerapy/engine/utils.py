@@ -2,7 +2,6 @@ import asyncio
 import datetime
 import enum
 import errno
-import json
 import queue
 import socket
 import time
@@ -11,6 +10,8 @@ from concurrent.futures import Future
 from typing import Any, Callable, Coroutine, Dict, Optional, Tuple, Union
 
 # Third-party
+import orjson
+
 # Internal
 from chimerapy.engine import _logger
 
@@ -25,14 +26,12 @@ def clear_queue(input_queue: queue.Queue):
         input_queue (queue.Queue): Queue to be cleared.
     """
 
-    while input_queue.qsize() != 0:
-        logger.debug(f"size={input_queue.qsize()}")
-        # Make sure to account for possible atomic modification of the
-        # queue
+    # Drain until empty, without relying on ``qsize`` (unreliable across
+    # platforms and an extra call per item)
+    while True:
         try:
-            input_queue.get(timeout=0.1, block=False)
+            input_queue.get_nowait()
         except queue.Empty:
-            logger.debug("clear_queue: empty!")
             return
         except EOFError:
             logger.warning("Queue EOFError --- data corruption")
@@ -163,8 +162,14 @@ def create_payload(
     return payload
 
 
-def decode_payload(data: str) -> Dict[str, Any]:
-    return json.loads(data)
+def encode_payload(payload: Dict[str, Any]) -> str:
+    return orjson.dumps(
+        payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
+def decode_payload(data: Union[str, bytes]) -> Dict[str, Any]:
+    return orjson.loads(data)
 
 
 def megabytes_to_bytes(megabytes: int) -> int:
@@ -48,6 +48,10 @@ class HttpClientService(Service):
         self.manager_port = -1
         self.manager_url = ""
 
+        # Coalescing of the node status updates sent to the Manager
+        self._status_dirty: bool = False
+        self._status_task: Optional[asyncio.Task] = None
+
         # Services
         self.http_client = aiohttp.ClientSession()
 
@@ -60,7 +64,7 @@ class HttpClientService(Service):
             ),
             "WorkerState.changed": TypedObserver(
                 "WorkerState.changed",
-                on_asend=self._async_node_status_update,
+                on_asend=self._schedule_node_status_update,
                 handle_event="drop",
             ),
             "send_archive": TypedObserver(
@@ -78,6 +82,10 @@ class HttpClientService(Service):
 
     async def shutdown(self) -> bool:
 
+        # Let the last coalesced status update go out before leaving
+        if self._status_task and not self._status_task.done():
+            await self._status_task
+
         success = True
         if self.connected_to_manager:
             try:
@@ -338,6 +346,22 @@ class HttpClientService(Service):
 
         return False
 
+    def _schedule_node_status_update(self):
+
+        # Only mark the state as dirty, a single task sends the latest version
+        self._status_dirty = True
+        if self._status_task is None or self._status_task.done():
+            self._status_task = asyncio.create_task(self._coalesce_node_status_update())
+
+    async def _coalesce_node_status_update(self):
+
+        interval = config.get("worker.misc.status-interval")
+        while self._status_dirty:
+            # Wait to gather the burst of changes, then send them as one update
+            await asyncio.sleep(interval)
+            self._status_dirty = False
+            await self._async_node_status_update()
+
     async def _async_node_status_update(self) -> bool:
 
         if not self.connected_to_manager:
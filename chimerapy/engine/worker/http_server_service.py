@@ -3,10 +3,14 @@ import enum
 import logging
 import pathlib
 import pickle
-from typing import Dict, List
+import sys
+from typing import Any, Coroutine, Dict, Optional, Set
 
+import orjson
 from aiohttp import web
 
+from chimerapy.engine import config
+
 from ..data_protocols import (
     NodeDiagnostics,
     NodePubEntry,
@@ -15,9 +19,10 @@ from ..data_protocols import (
 from ..eventbus import Event, EventBus, TypedObserver
 from ..networking import Server
 from ..networking.enums import NODE_MESSAGE
+from ..networking.server import FileTransferRecord
 from ..service import Service
 from ..states import NodeState, WorkerState
-from ..utils import update_dataclass
+from ..utils import async_waiting_for, update_dataclass
 from .events import (
     BroadcastEvent,
     CreateNodeEvent,
@@ -31,8 +36,32 @@ from .events import (
     UpdateResultsEvent,
 )
 
+# Manager and Worker need matching Pythons for dill anyway, use the fastest protocol
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+def _ok() -> web.Response:
+    # A plain empty response, cheaper than building a web.HTTPOk exception
+    return web.Response(status=200)
+
 
 class HttpServerService(Service):
+
+    __slots__ = (
+        "state",
+        "eventbus",
+        "logger",
+        "tasks",
+        "server",
+        "observers",
+        "ip",
+        "port",
+        "url",
+        "_node_pub_table_json",
+        "_node_pub_table_dirty",
+        "_bus_asend",
+    )
+
     def __init__(
         self,
         name: str,
@@ -48,7 +77,11 @@ class HttpServerService(Service):
         self.logger = logger
 
         # Containers
-        self.tasks: List[asyncio.Task] = []
+        self.tasks: Set[asyncio.Task] = set()
+
+        # Cached pub table response, rebuilt only when the nodes change
+        self._node_pub_table_json: Optional[bytes] = None
+        self._node_pub_table_dirty: bool = True
 
         # Create server
         self.server = Server(
@@ -67,7 +100,7 @@ class HttpServerService(Service):
                 web.post("/nodes/registered_methods", self._async_request_method_route),
                 web.post("/nodes/stop", self._async_stop_nodes_route),
                 web.post("/nodes/diagnostics", self._async_diagnostics_route),
-                # web.post("/packages/load", self._async_load_sent_packages),
+                web.post("/packages/load", self._async_load_sent_packages),
                 web.post("/shutdown", self._async_shutdown_route),
             ],
             ws_handlers={
@@ -79,17 +112,8 @@ class HttpServerService(Service):
             parent_logger=self.logger,
         )
 
-    @property
-    def ip(self) -> str:
-        return self._ip
-
-    @property
-    def port(self) -> int:
-        return self._port
-
-    @property
-    def url(self) -> str:
-        return f"http://{self._ip}:{self._port}"
+        # Pre-bind the eventbus' send, used by every route
+        self._bus_asend = self.eventbus.asend
 
     async def async_init(self):
 
@@ -111,19 +135,26 @@ class HttpServerService(Service):
                 on_asend=self._async_send,
                 handle_event="unpack",
             ),
+            "WorkerState.changed": TypedObserver(
+                "WorkerState.changed",
+                on_asend=self._invalidate_node_pub_table,
+                handle_event="drop",
+            ),
         }
-        for ob in self.observers.values():
-            await self.eventbus.asubscribe(ob)
+        await self.eventbus.asubscribe_many(self.observers.values())
 
     async def start(self):
 
         # Runn the Server
         await self.server.async_serve()
 
-        # Update the ip and port
-        self._ip, self._port = self.server.host, self.server.port
+        # Update the ip and port, they don't change after startup
+        self.ip: str = self.server.host
+        self.port: int = self.server.port
+        self.url: str = f"http://{self.ip}:{self.port}"
         self.state.ip = self.ip
         self.state.port = self.port
+        self._invalidate_node_pub_table()
 
         # After updatign the information, then run it!
         await self.eventbus.asend(Event("after_server_startup"))
@@ -143,15 +174,43 @@ class HttpServerService(Service):
     async def _async_broadcast(self, signal: enum.Enum, data: Dict) -> bool:
         return await self.server.async_broadcast(signal=signal, data=data)
 
+    def _invalidate_node_pub_table(self):
+        self._node_pub_table_dirty = True
+
+    def _get_package_record(
+        self, filename: str, records: Optional[Dict[str, FileTransferRecord]] = None
+    ) -> Optional[FileTransferRecord]:
+        if records is None:
+            records = self.server.file_transfer_records.records
+        for record in records.values():
+            if record.filename == filename:
+                return record
+        return None
+
     def _create_node_pub_table(self) -> NodePubTable:
 
-        # Construct simple data structure for Node to address information
-        node_pub_table = NodePubTable()
-        for node_id, node_state in self.state.nodes.items():
-            node_entry = NodePubEntry(ip=self.state.ip, port=node_state.port)
-            node_pub_table.table[node_id] = node_entry
+        # Construct simple data structure for Node to address information,
+        # all the Nodes share the Worker's ip
+        ip = self.state.ip
+        return NodePubTable(
+            table={
+                node_id: NodePubEntry(ip=ip, port=node_state.port)
+                for node_id, node_state in self.state.nodes.items()
+            }
+        )
+
+    def _create_task(self, coro: Coroutine) -> asyncio.Task:
+        # Keep a reference until done, then drop it so tasks don't accumulate
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
 
-        return node_pub_table
+    async def _read_json(self, request: web.Request) -> Any:
+        # Skip reading and parsing altogether for empty bodies
+        if not request.body_exists or request.content_length == 0:
+            return {}
+        return orjson.loads(await request.read())
 
     async def _collect_and_send(self, path: pathlib.Path):
         # Collect data from the Nodes
@@ -165,104 +224,119 @@ class HttpServerService(Service):
     ## HTTP Routes
     ####################################################################
 
-    # async def _async_load_sent_packages(self, request: web.Request) -> web.Response:
-    #     msg = await request.json()
-
-    #     # For each package, extract it from the client's tempfolder
-    #     # and load it to the sys.path
-    #     for sent_package in msg["packages"]:
-
-    #         # Wait until the sent package are started
-    #         success = await async_waiting_for(
-    #             condition=lambda: f"{sent_package}.zip"
-    #             in self.server.file_transfer_records["Manager"],
-    #             timeout=config.get("worker.timeout.package-delivery"),
-    #         )
-
-    #         if success:
-    #             self.logger.debug(
-    #                 f"{self}: Waiting for package {sent_package}: SUCCESS"
-    #             )
-    #         else:
-    #             self.logger.error(f"{self}: Waiting for "
-    #             "package {sent_package}: FAILED")
-    #             return web.HTTPError()
-
-    #         # Get the path
-    #         package_zip_path = self.server.file_transfer_records["Manager"][
-    #             f"{sent_package}.zip"
-    #         ]["dst_filepath"]
-
-    #         # Wait until the sent package is complete
-    #         success = await async_waiting_for(
-    #             condition=lambda: self.server.file_transfer_records["Manager"][
-    #                 f"{sent_package}.zip"
-    #             ]["complete"]
-    #             is True,
-    #             timeout=config.get("worker.timeout.package-delivery"),
-    #         )
-
-    #         if success:
-    #             self.logger.debug(f"{self}: Package {sent_package} loading: SUCCESS")
-    #         else:
-    #             self.logger.debug(f"{self}: Package {sent_package} loading: FAILED")
-
-    #         assert (
-    #             package_zip_path.exists()
-    #         ), f"{self}: {package_zip_path} doesn't exists!?"
-    #         sys.path.insert(0, str(package_zip_path))
-
-    #     # Send message back to the Manager letting them know that
-    #     return web.HTTPOk()
+    async def _async_load_sent_package(self, sent_package: str) -> bool:
+
+        # Resolve the filename and records once, not on every poll
+        zip_name = f"{sent_package}.zip"
+        records = self.server.file_transfer_records.records
+
+        # Wait until the sent package are started
+        success = await async_waiting_for(
+            condition=lambda: self._get_package_record(zip_name, records) is not None,
+            timeout=config.get("worker.timeout.package-delivery"),
+        )
+
+        if success:
+            self.logger.debug(f"{self}: Waiting for package {sent_package}: SUCCESS")
+        else:
+            self.logger.error(f"{self}: Waiting for package {sent_package}: FAILED")
+            return False
+
+        # Get the path
+        record = self._get_package_record(zip_name, records)
+        assert record is not None
+        package_zip_path = record.location
+
+        # Wait until the sent package is complete
+        success = await async_waiting_for(
+            condition=lambda: record.complete is True,
+            timeout=config.get("worker.timeout.package-delivery"),
+        )
+
+        if success:
+            self.logger.debug(f"{self}: Package {sent_package} loading: SUCCESS")
+        else:
+            self.logger.error(f"{self}: Package {sent_package} loading: FAILED")
+            return False
+
+        assert package_zip_path.exists(), f"{self}: {package_zip_path} doesn't exists!?"
+        sys.path.insert(0, str(package_zip_path))
+        return True
+
+    async def _async_load_sent_packages(self, request: web.Request) -> web.Response:
+        msg = await self._read_json(request)
+
+        # For each package, extract it from the client's tempfolder
+        # and load it to the sys.path. Packages don't depend on each other,
+        # so wait for all of them concurrently
+        results = await asyncio.gather(
+            *[self._async_load_sent_package(p) for p in msg["packages"]],
+            return_exceptions=True,
+        )
+
+        failed = [p for p, r in zip(msg["packages"], results) if r is not True]
+        if failed:
+            self.logger.error(f"{self}: Loading packages {failed}: FAILED")
+            return web.Response(status=500)
+
+        # Send message back to the Manager letting them know that
+        return _ok()
 
     async def _async_create_node_route(self, request: web.Request) -> web.Response:
         msg_bytes = await request.read()
 
         # Create node
         node_config = pickle.loads(msg_bytes)
-        await self.eventbus.asend(Event("create_node", CreateNodeEvent(node_config)))
+        await self._bus_asend(Event("create_node", CreateNodeEvent(node_config)))
 
-        return web.HTTPOk()
+        return _ok()
 
     async def _async_destroy_node_route(self, request: web.Request) -> web.Response:
-        msg = await request.json()
+        msg = await self._read_json(request)
 
         # Destroy Node
         node_id = msg["id"]
-        await self.eventbus.asend(Event("destroy_node", DestroyNodeEvent(node_id)))
+        await self._bus_asend(Event("destroy_node", DestroyNodeEvent(node_id)))
 
-        return web.HTTPOk()
+        return _ok()
 
     async def _async_get_node_pub_table(self, request: web.Request) -> web.Response:
 
-        node_pub_table = self._create_node_pub_table()
-        return web.json_response(node_pub_table.to_json())
+        # Only rebuild the table if the nodes have changed since the last request
+        if self._node_pub_table_dirty or self._node_pub_table_json is None:
+            node_pub_table = self._create_node_pub_table()
+            self._node_pub_table_json = orjson.dumps(node_pub_table.to_json())
+            self._node_pub_table_dirty = False
+
+        return web.Response(
+            body=self._node_pub_table_json, content_type="application/json"
+        )
 
     async def _async_process_node_pub_table(self, request: web.Request) -> web.Response:
-        msg = await request.json()
+        msg = await self._read_json(request)
         node_pub_table: NodePubTable = NodePubTable.from_dict(msg)
 
         # Broadcasting the node server data
-        await self.eventbus.asend(
+        await self._bus_asend(
             Event("process_node_pub_table", ProcessNodePubTableEvent(node_pub_table))
         )
 
-        return web.HTTPOk()
+        return _ok()
 
     async def _async_step_route(self, request: web.Request) -> web.Response:
-        await self.eventbus.asend(Event("step_nodes"))
-        return web.HTTPOk()
+        await self._bus_asend(Event("step_nodes"))
+        return _ok()
 
     async def _async_start_nodes_route(self, request: web.Request) -> web.Response:
-        await self.eventbus.asend(Event("start_nodes"))
-        return web.HTTPOk()
+        await self._bus_asend(Event("start_nodes"))
+        return _ok()
 
     async def _async_record_route(self, request: web.Request) -> web.Response:
-        await self.eventbus.asend(Event("record_nodes"))
-        return web.HTTPOk()
+        await self._bus_asend(Event("record_nodes"))
+        return _ok()
 
     async def _async_request_method_route(self, request: web.Request) -> web.Response:
-        msg = await request.json()
+        msg = await self._read_json(request)
 
         # Get event information
         event_data = RegisteredMethodEvent(
@@ -270,39 +344,39 @@ class HttpServerService(Service):
         )
 
         # Send it!
-        await self.eventbus.asend(Event("registered_method", event_data))
+        await self._bus_asend(Event("registered_method", event_data))
 
-        return web.HTTPOk()
+        return _ok()
 
     async def _async_stop_nodes_route(self, request: web.Request) -> web.Response:
-        await self.eventbus.asend(Event("stop_nodes"))
-        return web.HTTPOk()
+        await self._bus_asend(Event("stop_nodes"))
+        return _ok()
 
     async def _async_report_node_gather(self, request: web.Request) -> web.Response:
-        await self.eventbus.asend(Event("gather_nodes"))
+        await self._bus_asend(Event("gather_nodes"))
 
         self.logger.warning(f"{self}: gather doesn't work ATM.")
         gather_data = {"id": self.state.id, "node_data": {}}
-        return web.Response(body=pickle.dumps(gather_data))
+        return web.Response(body=pickle.dumps(gather_data, protocol=_PICKLE_PROTOCOL))
 
     async def _async_collect(self, request: web.Request) -> web.Response:
-        data = await request.json()
-        asyncio.create_task(self._collect_and_send(pathlib.Path(data["path"])))
-        return web.HTTPOk()
+        data = await self._read_json(request)
+        self._create_task(self._collect_and_send(pathlib.Path(data["path"])))
+        return _ok()
 
     async def _async_diagnostics_route(self, request: web.Request) -> web.Response:
-        data = await request.json()
+        data = await self._read_json(request)
 
         # Determine if enable/disable
         event_data = EnableDiagnosticsEvent(data["enable"])
-        await self.eventbus.asend(Event("diagnostics", event_data))
-        return web.HTTPOk()
+        await self._bus_asend(Event("diagnostics", event_data))
+        return _ok()
 
     async def _async_shutdown_route(self, request: web.Request) -> web.Response:
         # Execute shutdown after returning HTTPOk (prevent Manager stuck waiting)
-        self.tasks.append(asyncio.create_task(self.eventbus.asend(Event("shutdown"))))
+        self._create_task(self._bus_asend(Event("shutdown")))
 
-        return web.HTTPOk()
+        return _ok()
 
     ####################################################################
     ## WS Routes
@@ -311,7 +385,7 @@ class HttpServerService(Service):
     async def _async_node_status_update(self, msg: Dict, ws: web.WebSocketResponse):
 
         # self.logger.debug(f"{self}: note_status_update: :{msg}")
-        node_state = NodeState.from_dict(msg["data"])
+        node_state = NodeState.from_dict_fast(msg["data"])
         node_id = node_state.id
 
         # Update our records by grabbing all data from the msg
@@ -319,6 +393,7 @@ class HttpServerService(Service):
 
             # Update the node state
             update_dataclass(self.state.nodes[node_id], node_state)
+            self._invalidate_node_pub_table()
             await self.eventbus.asend(Event("WorkerState.changed", self.state))
 
     async def _async_node_report_gather(self, msg: Dict, ws: web.WebSocketResponse):
@@ -47,8 +47,8 @@ class ContextSession(abc.ABC):
         self.futures.append(ret)
         return ret
 
-    def shutdown(self):
-        self.executor.shutdown()
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait=wait)
 
 
 class MPSession(ContextSession):
@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import logging
 import typing
 from typing import Any, Awaitable, Optional, Union
@@ -18,7 +19,7 @@ class NodeController(abc.ABC):
     running: Union[bool, mp.Value]
     node_object: "Node"
     future: Optional[Awaitable]
-    response: bool = False
+    response: asyncio.Event
     gather: DataChunk = DataChunk()
     registered_method_results: Any = None
 
@@ -29,6 +30,9 @@ class NodeController(abc.ABC):
         self.logger = logger
         self.future = None
 
+        # Set when the Node reports back, instead of polling a flag
+        self.response = asyncio.Event()
+
     @abc.abstractmethod
     def run(self, context: ContextSession):
         ...
@@ -37,6 +41,15 @@ class NodeController(abc.ABC):
     def stop(self):
         ...
 
+    async def wait_for_response(
+        self, timeout: Optional[Union[int, float]] = None
+    ) -> bool:
+        try:
+            await asyncio.wait_for(self.response.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def shutdown(self):
         if self.future:
             self.stop()
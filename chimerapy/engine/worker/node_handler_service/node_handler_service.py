@@ -17,7 +17,7 @@ from ...networking.enums import WORKER_MESSAGE
 from ...node.node_config import NodeConfig
 from ...node.worker_comms_service import WorkerCommsService
 from ...service import Service
-from ...states import NodeState, WorkerState
+from ...states import NodeFSM, NodeState, WorkerState
 from ...utils import async_waiting_for
 from ..events import (
     BroadcastEvent,
@@ -145,15 +145,24 @@ class NodeHandlerService(Service):
 
     async def shutdown(self) -> bool:
 
-        tasks = [
-            self.node_controllers[node_id].shutdown()
-            for node_id in self.node_controllers
-        ]
-        await asyncio.gather(*tasks)
+        # Signal all the Nodes first, then wait for them together (bounded)
+        for controller in self.node_controllers.values():
+            controller.stop()
 
-        # Close all the sessions
-        self.mp_session.shutdown()
-        self.thread_session.shutdown()
+        futures = [c.future for c in self.node_controllers.values() if c.future]
+        pending: set = set()
+        if futures:
+            _, pending = await asyncio.wait(
+                futures, timeout=config.get("worker.timeout.node-shutdown")
+            )
+            if pending:
+                self.logger.warning(
+                    f"{self}: {len(pending)} Node(s) did not shutdown in time"
+                )
+
+        # Close all the sessions, without blocking on Nodes that are stuck
+        self.mp_session.shutdown(wait=not pending)
+        self.thread_session.shutdown(wait=not pending)
 
         # Clear node_controllers afterwards
         self.node_controllers = {}
@@ -166,11 +175,11 @@ class NodeHandlerService(Service):
 
     def update_gather(self, node_id: str, gather: Any):
         self.node_controllers[node_id].gather = gather
-        self.node_controllers[node_id].response = True
+        self.node_controllers[node_id].response.set()
 
     def update_results(self, node_id: str, results: Any):
         self.node_controllers[node_id].registered_method_results = results
-        self.node_controllers[node_id].response = True
+        self.node_controllers[node_id].response.set()
 
     ###################################################################################
     ## Node Handling
@@ -233,7 +242,8 @@ class NodeHandlerService(Service):
 
             # Wait until response from node
             success = await async_waiting_for(
-                condition=lambda: self.state.nodes[id].fsm in ["INITIALIZED", "READY"],
+                condition=lambda: self.state.nodes[id].fsm
+                in (NodeFSM.INITIALIZED, NodeFSM.READY),
                 timeout=config.get("worker.timeout.node-creation"),
             )
 
@@ -244,7 +254,7 @@ class NodeHandlerService(Service):
 
             # Now we wait until the node has fully initialized and ready-up
             success = await async_waiting_for(
-                condition=lambda: self.state.nodes[id].fsm == "READY",
+                condition=lambda: self.state.nodes[id].fsm is NodeFSM.READY,
                 timeout=config.get("worker.timeout.info-request"),
             )
 
@@ -300,7 +310,8 @@ class NodeHandlerService(Service):
         for node_id in self.state.nodes:
             for i in range(config.get("worker.allowed-failures")):
                 if await async_waiting_for(
-                    condition=lambda: self.state.nodes[node_id].fsm == "CONNECTED",
+                    condition=lambda: self.state.nodes[node_id].fsm
+                    is NodeFSM.CONNECTED,
                     timeout=config.get("worker.timeout.info-request"),
                 ):
                     # self.logger.debug(f"{self}: Node {node_id} has connected: SUCCES")
@@ -341,13 +352,10 @@ class NodeHandlerService(Service):
         await self.eventbus.asend(
             Event("broadcast", BroadcastEvent(signal=WORKER_MESSAGE.STOP_NODES))
         )
+        # Short-circuit on the first Node still running, without building a list
+        stopped = (NodeFSM.STOPPED, NodeFSM.SAVED, NodeFSM.SHUTDOWN)
         await async_waiting_for(
-            lambda: all(
-                [
-                    x.fsm in ["STOPPED", "SAVED", "SHUTDOWN"]
-                    for x in self.state.nodes.values()
-                ]
-            )
+            lambda: all(x.fsm in stopped for x in self.state.nodes.values())
         )
         return True
 
@@ -356,7 +364,7 @@ class NodeHandlerService(Service):
     ) -> Dict[str, Any]:
 
         # Mark that the node hasn't responsed
-        self.node_controllers[node_id].response = False
+        self.node_controllers[node_id].response.clear()
         self.logger.debug(
             f"{self}: Requesting registered method: {method_name}@{node_id}"
         )
@@ -369,9 +377,7 @@ class NodeHandlerService(Service):
         await self.eventbus.asend(Event("send", event_data))
 
         # Then wait for the Node response
-        success = await async_waiting_for(
-            condition=lambda: self.node_controllers[node_id].response is True,
-        )
+        success = await self.node_controllers[node_id].wait_for_response()
 
         return {
             "success": success,
@@ -394,7 +400,7 @@ class NodeHandlerService(Service):
         # self.logger.debug(f"{self}: reporting to Manager gather request")
 
         for node_id in self.state.nodes:
-            self.node_controllers[node_id].response = False
+            self.node_controllers[node_id].response.clear()
 
         # Request gather from Worker to Nodes
         await self.eventbus.asend(
@@ -406,8 +412,7 @@ class NodeHandlerService(Service):
         for node_id in self.state.nodes:
             for i in range(config.get("worker.allowed-failures")):
 
-                if await async_waiting_for(
-                    condition=lambda: self.node_controllers[node_id].response is True,
+                if await self.node_controllers[node_id].wait_for_response(
                     timeout=config.get("worker.timeout.info-request"),
                 ):
                     # self.logger.debug(
@@ -448,7 +453,7 @@ class NodeHandlerService(Service):
             for node_id in self.state.nodes:
 
                 if await async_waiting_for(
-                    condition=lambda: self.state.nodes[node_id].fsm == "SAVED",
+                    condition=lambda: self.state.nodes[node_id].fsm is NodeFSM.SAVED,
                     timeout=None,
                 ):
                     # self.logger.debug(
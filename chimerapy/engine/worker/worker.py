@@ -1,7 +1,7 @@
 import pathlib
 import shutil
 import tempfile
-import time
+import threading
 import uuid
 from asyncio import Task
 from concurrent.futures import Future
@@ -69,6 +69,7 @@ class Worker:
 
         # Instance variables
         self._alive: bool = False
+        self._dead = threading.Event()
         self.shutdown_task: Optional[Task] = None
 
     async def aserve(self) -> bool:
@@ -262,6 +263,7 @@ class Worker:
             return True
         else:
             self._alive = False
+            self._dead.set()
 
         # Shutdown all services and Wait until all complete
         await self.eventbus.asend(Event("shutdown"))
@@ -351,8 +353,9 @@ class Worker:
 
     def idle(self):
 
+        # Wake up as soon as the Worker shuts down, instead of polling
         while self._alive:
-            time.sleep(2)
+            self._dead.wait(timeout=2)
 
     def shutdown(self, blocking: bool = True) -> Union[Future[bool], bool]:
         """Shutdown ``Worker`` safely.
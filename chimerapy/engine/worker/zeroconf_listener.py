@@ -1,6 +1,6 @@
 import logging
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import zeroconf
 from zeroconf import ServiceInfo, ServiceListener
@@ -44,8 +44,8 @@ class ZeroconfListener(ServiceListener):
                 self.logger.info(f"chimerapy-engine zeroconf service detected: {info}")
 
                 # Wait for wait_time seconds to confirm if this is the latest version
-                end_time = datetime.now() + timedelta(seconds=self.wait_time)
-                while datetime.now() < end_time:
+                end_time = time.monotonic() + self.wait_time
+                while time.monotonic() < end_time:
 
                     # Wait a little bit
                     time.sleep(1)
@@ -45,7 +45,7 @@ def text_data_chunk():
 def image_data_chunk():
     # Create the data
     data = cpe.DataChunk()
-    test_image = (np.random.rand(100, 100, 3) * 255).astype(np.uint8)
+    test_image = np.random.default_rng().integers(0, 256, (100, 100, 3), dtype=np.uint8)
     data.add(name="test_image", value=test_image, content_type="image")
     return data
 
@@ -2,6 +2,8 @@ import asyncio
 import time
 from typing import Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 from pytest_lazyfixture import lazy_fixture
 
@@ -193,3 +195,49 @@ async def test_main(ptype, processor_setup):
     assert CHANGE_FLAG
     if ptype == "step":
         assert RECEIVE_FLAG
+
+
+@pytest.mark.parametrize(
+    "output, sent",
+    [
+        (None, False),
+        (0, False),
+        (False, False),
+        ("", False),
+        ([], False),
+        ({}, False),
+        (1, True),
+        ("data", True),
+        (pd.DataFrame(), False),
+        (pd.DataFrame({"a": [1]}), True),
+        (np.zeros((2, 2)), True),
+        (np.zeros(0), False),
+        (np.int64(0), False),
+    ],
+)
+async def test_safe_step_skips_empty_output(output, sent):
+
+    eventbus = EventBus()
+    processor = ProcessorService(
+        "processor",
+        in_bound_data=False,
+        state=NodeState(),
+        eventbus=eventbus,
+        main_fn=lambda: output,
+        operation_mode="step",
+    )
+    await processor.async_init()
+    await processor.setup()
+
+    received = []
+    observer = TypedObserver(
+        "out_step",
+        NewOutBoundDataEvent,
+        on_asend=received.append,
+        handle_event="pass",
+    )
+    await eventbus.asubscribe(observer)
+
+    await processor.safe_step()
+    assert bool(received) == sent
+    await processor.teardown()
@@ -9,7 +9,7 @@ import pytest
 import chimerapy.engine as cpe
 from chimerapy.engine.eventbus import EventBus
 from chimerapy.engine.node.record_service import RecordService
-from chimerapy.engine.states import NodeState
+from chimerapy.engine.states import NodeFSM, NodeState
 
 logger = cpe._logger.getLogger("chimerapy-engine")
 
@@ -22,7 +22,7 @@ async def recorder():
 
     # Create sample state
     state = NodeState(logdir=pathlib.Path(tempfile.mkdtemp()))
-    state.fsm = "PREVIEWING"
+    state.fsm = NodeFSM.PREVIEWING
 
     # Create the recorder
     recorder = RecordService(name="recorder", state=state, eventbus=eventbus)
@@ -59,3 +59,32 @@ async def test_record_direct_submit(recorder):
 
     expected_file = recorder.state.logdir / "test.mp4"
     assert expected_file.exists()
+
+
+async def test_record_submit_many(recorder):
+
+    # Run the recorder
+    await recorder.setup()
+
+    timestamp = datetime.datetime.now()
+    frames = np.random.randint(0, 255, (50, 255, 255, 3), dtype=np.uint8)
+    video_entries = [
+        {
+            "uuid": uuid.UUID(int=i),
+            "name": "test",
+            "data": frames[i],
+            "dtype": "video",
+            "fps": 30,
+            "elapsed": 0,
+            "timestamp": timestamp,
+        }
+        for i in range(50)
+    ]
+
+    recorder.submit_many(video_entries)
+
+    recorder.collect()
+    await recorder.teardown()
+
+    expected_file = recorder.state.logdir / "test.mp4"
+    assert expected_file.exists()
@@ -1,16 +1,18 @@
 # Build-in Imports
+import asyncio
 import random
 import time
 
 import numpy as np
 import pandas as pd
 
-# Third-party Imports
-import pyaudio
-
 # Internal Imports
 import chimerapy.engine as cpe
 
+# Constants
+PA_INT16 = 8  # == pyaudio.paInt16, without importing PortAudio
+_rng = np.random.default_rng()
+
 
 class AudioNode(cpe.Node):
     def __init__(
@@ -18,7 +20,7 @@ class AudioNode(cpe.Node):
         name: str,
         chunk: int = 1024,
         channels: int = 2,
-        format: int = pyaudio.paInt16,
+        format: int = PA_INT16,
         rate: int = 44100,
         **kwargs,
     ):
@@ -28,9 +30,9 @@ class AudioNode(cpe.Node):
         self.format = format
         self.rate = rate
 
-    def step(self):
+    async def step(self):
 
-        time.sleep(1 / 20)
+        await asyncio.sleep(1 / 20)
         data = np.random.rand(self.chunk) * 2 - 1
         self.save_audio(
             name="test",
@@ -42,17 +44,17 @@ class AudioNode(cpe.Node):
 
 
 class ImageNode(cpe.Node):
-    def step(self):
-        time.sleep(1 / 10)
-        rand_frame = np.random.rand(20, 30, 3) * 255
+    async def step(self):
+        await asyncio.sleep(1 / 10)
+        rand_frame = _rng.integers(0, 256, (20, 30, 3), dtype=np.uint8)
         self.save_image(name="test", data=rand_frame)
 
 
 class TabularNode(cpe.Node):
-    def step(self):
+    async def step(self):
 
-        time.sleep(1 / 10)
-        self.logger.debug(f"{self}: step: {self.state.fsm}")
+        await asyncio.sleep(1 / 10)
+        self.logger.debug(f"{self}: step: {self.state.fsm.name}")
 
         # Testing different types
         data = {"time": time.time(), "content": "HELLO"}
@@ -66,15 +68,15 @@ class TabularNode(cpe.Node):
 
 
 class VideoNode(cpe.Node):
-    def step(self):
-        time.sleep(1 / 15)
-        rand_frame = np.random.rand(720, 1280, 3) * 255
+    async def step(self):
+        await asyncio.sleep(1 / 15)
+        rand_frame = _rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8)
         self.save_video(name="test", data=rand_frame, fps=15)
 
 
 class JSONNode(cpe.Node):
-    def step(self):
-        time.sleep(1 / 10)
+    async def step(self):
+        await asyncio.sleep(1 / 10)
         data = {"time": time.time(), "content": "HELLO"}
         self.save_json(name="test", data=data)
 
@@ -83,8 +85,8 @@ class TextNode(cpe.Node):
     def setup(self):
         self.step_count = 0
 
-    def step(self):
-        time.sleep(1 / 10)
+    async def step(self):
+        await asyncio.sleep(1 / 10)
         num_lines = random.randint(1, 5)
         self.step_count += 1
         lines = []
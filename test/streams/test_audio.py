@@ -1,5 +1,4 @@
 # Built-in Imports
-import asyncio
 import datetime
 import glob
 import os
@@ -10,7 +9,6 @@ import wave
 
 # Third-party
 import numpy as np
-import pyaudio
 import pytest
 
 # Internal Imports
@@ -18,7 +16,8 @@ import chimerapy.engine as cpe
 from chimerapy.engine.eventbus import Event, EventBus
 from chimerapy.engine.records.audio_record import AudioRecord
 
-from .data_nodes import AudioNode
+from ..utils import wait_for_path
+from .data_nodes import PA_INT16, AudioNode
 
 logger = cpe._logger.getLogger("chimerapy-engine")
 
@@ -26,7 +25,7 @@ logger = cpe._logger.getLogger("chimerapy-engine")
 CWD = pathlib.Path(os.path.abspath(__file__)).parent.parent
 TEST_DATA_DIR = CWD / "data"
 CHUNK = 1024
-FORMAT = pyaudio.paInt16
+FORMAT = PA_INT16
 CHANNELS = 2
 RATE = 44100
 RECORD_SECONDS = 2
@@ -56,7 +55,7 @@ def test_audio_writer(input_file):
         for j in range(f.getnframes()):
             frame = f.readframes(1)
             datachunk = {
-                "uuid": uuid.uuid4(),
+                "uuid": uuid.UUID(int=j),
                 "name": "pvrecorder-test",
                 "data": frame,
                 "dtype": "audio",
@@ -92,11 +91,16 @@ def test_audio_record():
     # Create the record
     ar = AudioRecord(dir=TEST_DATA_DIR, name="test")
 
+    # Generate all the chunks up-front, instead of one array per iteration
+    num_chunks = int(RATE / CHUNK * RECORD_SECONDS)
+    rng = np.random.default_rng(0)
+    bulk = rng.random((num_chunks, CHUNK)) * 2 - 1
+
     # Write to audio file
-    for i in range(0, int(RATE / CHUNK * RECORD_SECONDS)):
-        data = (np.random.rand(CHUNK) * 2 - 1) * (i * 0.1)
+    for i in range(num_chunks):
+        data = bulk[i] * (i * 0.1)
         audio_chunk = {
-            "uuid": uuid.uuid4(),
+            "uuid": uuid.UUID(int=i),
             "name": "test",
             "data": data,
             "dtype": "audio",
@@ -118,24 +122,26 @@ async def test_node_save_audio_stream(audio_node):
 
     # Check that the audio was created
     expected_audio_path = pathlib.Path(audio_node.state.logdir) / "test.wav"
-    # try:
-    #     os.remove(expected_audio_path)
-    # except FileNotFoundError:
-    #     ...
+    try:
+        os.remove(expected_audio_path)
+    except FileNotFoundError:
+        ...
 
     # Stream
     await audio_node.arun(eventbus=eventbus)
 
-    # Wait to generate files
-    await eventbus.asend(Event("start"))
-    logger.debug("Finish start")
-    await eventbus.asend(Event("record"))
-    logger.debug("Finish record")
-    await asyncio.sleep(3)
-    await eventbus.asend(Event("stop"))
-    logger.debug("Finish stop")
-
-    await audio_node.ashutdown()
+    # Wait to generate files, always stopping the Node
+    try:
+        await eventbus.asend(Event("start"))
+        logger.debug("Finish start")
+        await eventbus.asend(Event("record"))
+        logger.debug("Finish record")
+        assert await wait_for_path(expected_audio_path)
+    finally:
+        await eventbus.asend(Event("stop"))
+        logger.debug("Finish stop")
+
+        await audio_node.ashutdown()
 
     # Check that the audio was created
     assert expected_audio_path.exists()
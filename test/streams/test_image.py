@@ -1,10 +1,11 @@
 # Built-in Imports
-import asyncio
 import os
 import pathlib
+import tempfile
 import uuid
 
 # Third-party
+import cv2
 import numpy as np
 import pytest
 
@@ -13,6 +14,7 @@ import chimerapy.engine as cpe
 from chimerapy.engine.eventbus import Event, EventBus
 from chimerapy.engine.records.image_record import ImageRecord
 
+from ..utils import wait_for_path
 from .data_nodes import ImageNode
 
 logger = cpe._logger.getLogger("chimerapy-engine")
@@ -35,6 +37,10 @@ def test_image_record():
 
     # Check that the image was created
     expected_image_path = TEST_DATA_DIR / "test" / "0.png"
+    try:
+        os.remove(expected_image_path)
+    except FileNotFoundError:
+        ...
     try:
         os.rmdir(expected_image_path.parent)
     except OSError:
@@ -43,11 +49,14 @@ def test_image_record():
     # Create the record
     img_r = ImageRecord(dir=TEST_DATA_DIR, name="test")
 
+    # Generate all the frames up-front, instead of one array per iteration
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, (5, 200, 300, 3), dtype=np.uint8)
+
     # Write to image file
-    for i in range(5):
-        data = np.random.rand(200, 300, 3) * 255
+    for i, data in enumerate(frames):
         image_chunk = {
-            "uuid": uuid.uuid4(),
+            "uuid": uuid.UUID(int=i),
             "name": "test",
             "data": data,
             "dtype": "image",
@@ -58,6 +67,26 @@ def test_image_record():
     assert expected_image_path.exists()
 
 
+def test_image_record_write_many():
+
+    save_dir = pathlib.Path(tempfile.mkdtemp())
+    img_r = ImageRecord(dir=save_dir, name="test")
+
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, (5, 200, 300, 3), dtype=np.uint8)
+    img_r.write_many(
+        [
+            {"uuid": uuid.UUID(int=i), "name": "test", "data": data, "dtype": "image"}
+            for i, data in enumerate(frames)
+        ]
+    )
+    img_r.close()
+
+    # Every frame must land in its own index, regardless of the encoding order
+    for i, data in enumerate(frames):
+        assert (cv2.imread(str(save_dir / "test" / f"{i}.png")) == data).all()
+
+
 async def test_node_save_image_stream(image_node):
 
     # Event Loop
@@ -65,6 +94,10 @@ async def test_node_save_image_stream(image_node):
 
     # Check that the image was created
     expected_image_path = pathlib.Path(image_node.state.logdir) / "test" / "0.png"
+    try:
+        os.remove(expected_image_path)
+    except FileNotFoundError:
+        ...
     try:
         os.rmdir(expected_image_path.parent)
     except OSError:
@@ -73,16 +106,18 @@ async def test_node_save_image_stream(image_node):
     # Stream
     await image_node.arun(eventbus=eventbus)
 
-    # Wait to generate files
-    await eventbus.asend(Event("start"))
-    logger.debug("Finish start")
-    await eventbus.asend(Event("record"))
-    logger.debug("Finish record")
-    await asyncio.sleep(3)
-    await eventbus.asend(Event("stop"))
-    logger.debug("Finish stop")
-
-    await image_node.ashutdown()
+    # Wait to generate files, always stopping the Node
+    try:
+        await eventbus.asend(Event("start"))
+        logger.debug("Finish start")
+        await eventbus.asend(Event("record"))
+        logger.debug("Finish record")
+        assert await wait_for_path(expected_image_path)
+    finally:
+        await eventbus.asend(Event("stop"))
+        logger.debug("Finish stop")
+
+        await image_node.ashutdown()
 
     # Check that the image was created
     assert expected_image_path.exists()
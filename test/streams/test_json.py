@@ -1,5 +1,4 @@
 # Built-in Imports
-import asyncio
 import json
 import os
 import pathlib
@@ -13,6 +12,7 @@ import chimerapy.engine as cpe
 from chimerapy.engine.eventbus import Event, EventBus
 from chimerapy.engine.records.json_record import JSONRecord
 
+from ..utils import wait_for_path
 from .data_nodes import JSONNode
 
 logger = cpe._logger.getLogger("chimerapy-engine")
@@ -34,6 +34,10 @@ def test_image_record():
 
     # Check that the image was created
     expected_jsonl_path = TEST_DATA_DIR / "test-5.jsonl"
+    try:
+        os.remove(expected_jsonl_path)
+    except FileNotFoundError:
+        ...
     try:
         os.rmdir(expected_jsonl_path.parent)
     except OSError:
@@ -91,6 +95,10 @@ async def test_node_save_json_stream(json_node):
 
     # Check that the image was created
     expected_jsonl_path = pathlib.Path(json_node.state.logdir) / "test.jsonl"
+    try:
+        os.remove(expected_jsonl_path)
+    except FileNotFoundError:
+        ...
     try:
         os.rmdir(expected_jsonl_path.parent)
     except OSError:
@@ -99,16 +107,18 @@ async def test_node_save_json_stream(json_node):
     # Stream
     await json_node.arun(eventbus=eventbus)
 
-    # Wait to generate files
-    await eventbus.asend(Event("start"))
-    logger.debug("Finish start")
-    await eventbus.asend(Event("record"))
-    logger.debug("Finish record")
-    await asyncio.sleep(3)
-    await eventbus.asend(Event("stop"))
-    logger.debug("Finish stop")
-
-    await json_node.ashutdown()
+    # Wait to generate files, always stopping the Node
+    try:
+        await eventbus.asend(Event("start"))
+        logger.debug("Finish start")
+        await eventbus.asend(Event("record"))
+        logger.debug("Finish record")
+        assert await wait_for_path(expected_jsonl_path)
+    finally:
+        await eventbus.asend(Event("stop"))
+        logger.debug("Finish stop")
+
+        await json_node.ashutdown()
 
     # Check that the image was created
     assert expected_jsonl_path.exists()
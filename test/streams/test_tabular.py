@@ -1,5 +1,4 @@
 # Built-in Imports
-import asyncio
 import os
 import pathlib
 import time
@@ -12,6 +11,7 @@ import chimerapy.engine as cpe
 from chimerapy.engine.eventbus import Event, EventBus
 from chimerapy.engine.records.tabular_record import TabularRecord
 
+from ..utils import wait_for_path
 from .data_nodes import TabularNode
 
 # Internal Imports
@@ -57,6 +57,38 @@ def test_tabular_record():
     assert expected_tabular_path.exists()
 
 
+def test_tabular_record_write_many():
+
+    # Writing a batch should match writing the chunks one by one
+    paths = [TEST_DATA_DIR / "test-single.csv", TEST_DATA_DIR / "test-many.csv"]
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            ...
+
+    tabular_chunks = [
+        {
+            "uuid": uuid.uuid4(),
+            "name": "test",
+            "data": {"time": float(i), "content": "HELLO"},
+            "dtype": "tabular",
+        }
+        for i in range(5)
+    ]
+
+    single_tr = TabularRecord(dir=TEST_DATA_DIR, name="test-single")
+    for tabular_chunk in tabular_chunks:
+        single_tr.write(tabular_chunk)
+
+    many_tr = TabularRecord(dir=TEST_DATA_DIR, name="test-many")
+    many_tr.write_many(tabular_chunks)
+
+    single_tr.close()
+    many_tr.close()
+    assert paths[0].read_text() == paths[1].read_text()
+
+
 async def test_node_save_tabular_stream(tabular_node):
 
     # Event Loop
@@ -72,16 +104,18 @@ async def test_node_save_tabular_stream(tabular_node):
     # Stream
     await tabular_node.arun(eventbus=eventbus)
 
-    # Wait to generate files
-    await eventbus.asend(Event("start"))
-    logger.debug("Finish start")
-    await eventbus.asend(Event("record"))
-    logger.debug("Finish record")
-    await asyncio.sleep(3)
-    await eventbus.asend(Event("stop"))
-    logger.debug("Finish stop")
-
-    await tabular_node.ashutdown()
+    # Wait to generate files, always stopping the Node
+    try:
+        await eventbus.asend(Event("start"))
+        logger.debug("Finish start")
+        await eventbus.asend(Event("record"))
+        logger.debug("Finish record")
+        assert await wait_for_path(expected_tabular_path)
+    finally:
+        await eventbus.asend(Event("stop"))
+        logger.debug("Finish stop")
+
+        await tabular_node.ashutdown()
 
     # Check that the tabular was created
     assert expected_tabular_path.exists()
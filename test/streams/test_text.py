@@ -1,5 +1,4 @@
 # Built-in Imports
-import asyncio
 import os
 import pathlib
 import uuid
@@ -12,6 +11,7 @@ import chimerapy.engine as cpe
 from chimerapy.engine.eventbus import Event, EventBus
 from chimerapy.engine.records.text_record import TextRecord
 
+from ..utils import wait_for_path
 from .data_nodes import TextNode
 
 logger = cpe._logger.getLogger("chimerapy-engine")
@@ -34,6 +34,10 @@ def test_text_record():
 
     # Check that the image was created
     expected_text_path = TEST_DATA_DIR / "test-5.log"
+    try:
+        os.remove(expected_text_path)
+    except FileNotFoundError:
+        ...
     try:
         os.rmdir(expected_text_path.parent)
     except OSError:
@@ -76,6 +80,10 @@ async def test_node_save_text_stream(text_node):
 
     # Check that the image was created
     expected_text_path = pathlib.Path(text_node.state.logdir) / "test.text"
+    try:
+        os.remove(expected_text_path)
+    except FileNotFoundError:
+        ...
     try:
         os.rmdir(expected_text_path.parent)
     except OSError:
@@ -84,16 +92,18 @@ async def test_node_save_text_stream(text_node):
     # Stream
     await text_node.arun(eventbus=eventbus)
 
-    # Wait to generate files
-    await eventbus.asend(Event("start"))
-    logger.debug("Finish start")
-    await eventbus.asend(Event("record"))
-    logger.debug("Finish record")
-    await asyncio.sleep(3)
-    await eventbus.asend(Event("stop"))
-    logger.debug("Finish stop")
-
-    await text_node.ashutdown()
+    # Wait to generate files, always stopping the Node
+    try:
+        await eventbus.asend(Event("start"))
+        logger.debug("Finish start")
+        await eventbus.asend(Event("record"))
+        logger.debug("Finish record")
+        assert await wait_for_path(expected_text_path)
+    finally:
+        await eventbus.asend(Event("stop"))
+        logger.debug("Finish stop")
+
+        await text_node.ashutdown()
 
     # Check that the image was created
     assert expected_text_path.exists()
@@ -14,6 +14,7 @@ import chimerapy.engine as cpe
 from chimerapy.engine.eventbus import Event, EventBus
 from chimerapy.engine.records.video_record import VideoRecord
 
+from ..utils import wait_for_path
 from .data_nodes import VideoNode
 
 # Internal Imports
@@ -50,10 +51,11 @@ def test_video_record():
     # Write to video file
     fps = 30
     start_time = vr.start_time
-    for i in range(fps):
-        data = np.random.rand(200, 300, 3) * 255
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, (fps, 200, 300, 3), dtype=np.uint8)
+    for i, data in enumerate(frames):
         video_chunk = {
-            "uuid": uuid.uuid4(),
+            "uuid": uuid.UUID(int=i),
             "name": "test",
             "data": data,
             "dtype": "video",
@@ -91,13 +93,14 @@ def test_video_record_with_unstable_frames():
     actual_fps = 10
     rec_time = 5
     start_time = vr.start_time
-    for i in range(rec_time * actual_fps):
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, (rec_time * actual_fps, 200, 300, 3), dtype=np.uint8)
+    for i, data in enumerate(frames):
 
         # But actually, we are getting frames at 20 fps
         timestamp = start_time + timedelta(seconds=i / actual_fps)
-        data = np.random.rand(200, 300, 3) * 255
         video_chunk = {
-            "uuid": uuid.uuid4(),
+            "uuid": uuid.UUID(int=i),
             "name": "test",
             "data": data,
             "dtype": "video",
@@ -135,16 +138,18 @@ async def test_node_save_video_stream(video_node):
     # Stream
     await video_node.arun(eventbus=eventbus)
 
-    # Wait to generate files
-    await eventbus.asend(Event("start"))
-    logger.debug("Finish start")
-    await eventbus.asend(Event("record"))
-    logger.debug("Finish record")
-    await asyncio.sleep(3)
-    await eventbus.asend(Event("stop"))
-    logger.debug("Finish stop")
-
-    await video_node.ashutdown()
+    # Wait to generate files, always stopping the Node
+    try:
+        await eventbus.asend(Event("start"))
+        logger.debug("Finish start")
+        await eventbus.asend(Event("record"))
+        logger.debug("Finish record")
+        assert await wait_for_path(expected_video_path)
+    finally:
+        await eventbus.asend(Event("stop"))
+        logger.debug("Finish stop")
+
+        await video_node.ashutdown()
 
     # Check that the video was created
     assert expected_video_path.exists()
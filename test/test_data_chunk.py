@@ -6,13 +6,15 @@ from pytest_lazyfixture import lazy_fixture
 
 import chimerapy.engine as cpe
 
+_rng = np.random.default_rng()
+
 
 @pytest.fixture
 def video_data_chunk():
     data_chunk = cpe.DataChunk()
     data_chunk.add(
         "image",
-        (np.random.rand(10, 10, 3) * 255).astype(np.uint8),
+        _rng.integers(0, 256, (10, 10, 3), dtype=np.uint8),
         content_type="image",
     )
     return data_chunk
@@ -23,7 +25,7 @@ def images_data_chunk():
     data_chunk = cpe.DataChunk()
     data_chunk.add(
         "images",
-        [(np.random.rand(10, 10, 3) * 255).astype(np.uint8) for _ in range(10)],
+        list(_rng.integers(0, 256, (10, 10, 10, 3), dtype=np.uint8)),
     )
     return data_chunk
 
@@ -33,7 +35,7 @@ def grey_images_data_chunk():
     data_chunk = cpe.DataChunk()
     data_chunk.add(
         "images",
-        [(np.random.rand(10, 10) * 255).astype(np.uint8) for _ in range(10)],
+        list(_rng.integers(0, 256, (10, 10, 10), dtype=np.uint8)),
     )
     return data_chunk
 
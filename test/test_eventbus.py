@@ -44,6 +44,13 @@ class NestedClass(DataClassJsonMixin):
     vector: List[str]
 
 
+async def start_waiting(event_bus: EventBus, event_type: str) -> asyncio.Task:
+    # Register the awaitable before the change schedules its event
+    waiter = asyncio.create_task(event_bus.await_event(event_type))
+    await asyncio.sleep(0)
+    return waiter
+
+
 @pytest.fixture
 def event_bus():
     # Creating the configuration for the eventbus and dataclasses
@@ -115,6 +122,21 @@ async def test_subscribe_and_unsubscribe():
     assert null2_event.id not in null_observer.received
 
 
+async def test_subscribe_many():
+
+    event_bus = EventBus()
+    obs = [TypedObserver("null") for _ in range(5)]
+
+    # Subscribe all to the event bus at once
+    await event_bus.asubscribe_many(obs)
+
+    # Send the event
+    null_event = Event("null")
+    await event_bus.asend(null_event)
+
+    assert all(null_event.id in ob.received for ob in obs)
+
+
 async def test_awaitable_event():
 
     event_bus = EventBus()
@@ -231,8 +253,9 @@ async def test_evented_dataclass(event_bus):
     data = SomeClass(number=1, string="hello")
 
     # Trigger an event by changing the class
+    waiter = await start_waiting(event_bus, "SomeClass.changed")
     data.number = 2
-    await asyncio.sleep(1)
+    await asyncio.wait_for(waiter, timeout=1)
 
     # Confirm
     assert len(local_variable) != 0
@@ -260,8 +283,9 @@ async def test_evented_wrapper(event_bus):
 
     # Trigger an event by changing the class
     logger.debug("Triggering manually")
+    waiter = await start_waiting(event_bus, "SomeClass.changed")
     data.number = 2
-    await asyncio.sleep(1)
+    await asyncio.wait_for(waiter, timeout=1)
 
     # Confirm
     assert len(local_variable) != 0
@@ -283,6 +307,21 @@ def test_make_evented(cls, kwargs, event_bus):
     data.to_json()
 
 
+async def test_make_evented_skips_unchanged(event_bus):
+    data = make_evented(SomeClass(number=1, string="hello"), event_bus=event_bus)
+
+    data.number = 2
+    await asyncio.sleep(0.5)
+    a = event_bus._event_counts
+    assert a > 0
+
+    # Re-assigning the same value should not emit
+    data.number = 2
+    data.string = "hello"
+    await asyncio.sleep(0.5)
+    assert event_bus._event_counts == a
+
+
 def test_make_evented_multiple(event_bus):
     # Create the evented class
     make_evented(SomeClass(number=1, string="hello"), event_bus=event_bus)
@@ -304,23 +343,27 @@ async def test_make_evented_nested(event_bus):
 
     logger.debug(data_class)
 
+    waiter = await start_waiting(event_bus, "NestedClass.changed")
     nested_data.number = 5
-    await asyncio.sleep(1)
+    await asyncio.wait_for(waiter, timeout=1)
     a = event_bus._event_counts
     assert a > 0
 
+    waiter = await start_waiting(event_bus, "NestedClass.changed")
     nested_data.map["new"] = "key"
-    await asyncio.sleep(1)
+    await asyncio.wait_for(waiter, timeout=1)
     b = event_bus._event_counts
     assert b > a
 
+    waiter = await start_waiting(event_bus, "NestedClass.changed")
     nested_data.subclass.message = "goodbye"
-    await asyncio.sleep(1)
+    await asyncio.wait_for(waiter, timeout=1)
     c = event_bus._event_counts
     assert c > b
 
+    waiter = await start_waiting(event_bus, "NestedClass.changed")
     nested_data.vector.append("this")
-    await asyncio.sleep(1)
+    await asyncio.wait_for(waiter, timeout=1)
     d = event_bus._event_counts
     assert d > c
 
@@ -0,0 +1,44 @@
+from chimerapy.engine.service import Service, ServiceGroup
+
+
+class CounterService(Service):
+    def __init__(self, name: str):
+        super().__init__(name=name)
+        self.counter = 0
+
+    def step(self):
+        self.counter += 1
+
+    async def async_step(self) -> str:
+        self.counter += 1
+        return self.name
+
+
+def test_service_group_apply():
+
+    services = ServiceGroup({"a": CounterService("a"), "b": CounterService("b")})
+    services.apply("step")
+    services.apply("step", order=["b"])
+
+    assert services["a"].counter == 1
+    assert services["b"].counter == 2
+
+
+async def test_service_group_async_apply():
+
+    services = ServiceGroup({"a": CounterService("a"), "b": CounterService("b")})
+    assert await services.async_apply("async_step") == ["a", "b"]
+    assert await services.async_apply("async_step", order=["b", "a"]) == ["b", "a"]
+
+
+async def test_service_group_cache_invalidation():
+
+    services = ServiceGroup({"a": CounterService("a")})
+    assert await services.async_apply("async_step") == ["a"]
+
+    # Changing the services should refresh the cached methods
+    services["b"] = CounterService("b")
+    assert await services.async_apply("async_step") == ["a", "b"]
+
+    services.pop("a")
+    assert await services.async_apply("async_step") == ["b"]
@@ -0,0 +1,38 @@
+import pathlib
+
+import pytest
+
+from chimerapy.engine.node.registered_method import RegisteredMethod
+from chimerapy.engine.states import NodeFSM, NodeState, WorkerState
+
+
+@pytest.mark.parametrize(
+    "node_state",
+    [
+        NodeState(logdir=None),
+        NodeState(
+            name="test",
+            port=5000,
+            fsm=NodeFSM.READY,
+            registered_methods={
+                "printout": RegisteredMethod(
+                    name="printout", style="blocking", params={"value": "int"}
+                )
+            },
+            logdir=pathlib.Path.cwd(),
+        ),
+    ],
+)
+def test_node_state_from_dict_fast(node_state):
+    data = node_state.to_dict()
+    assert NodeState.from_dict_fast(data) == NodeState.from_dict(data)
+
+
+def test_worker_state_from_dict_fast():
+    worker_state = WorkerState(
+        id="test",
+        name="test",
+        nodes={"a": NodeState(id="a", fsm=NodeFSM.CONNECTED), "b": NodeState(id="b")},
+    )
+    data = worker_state.to_dict()
+    assert WorkerState.from_dict_fast(data) == WorkerState.from_dict(data)
@@ -1,6 +1,8 @@
+import asyncio
 import os
 import pathlib
 import shutil
+import time
 from uuid import uuid4 as v4
 
 
@@ -10,6 +12,18 @@ def cleanup_and_recreate_dir(directory: pathlib.Path):
     os.makedirs(directory, exist_ok=True)
 
 
+async def wait_for_path(
+    path: pathlib.Path, timeout: float = 10, interval: float = 0.05
+) -> bool:
+    """Wait until path exists, up to timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists():
+            return True
+        await asyncio.sleep(interval)
+    return False
+
+
 def uuid() -> str:
     """Generate a UUID."""
     return str(v4())
@@ -1,5 +1,4 @@
 import asyncio
-import time
 from typing import Optional, Union
 
 import pytest
@@ -39,8 +38,9 @@ class NodeWithRegisteredMethods(cpe.Node):
         self.logger.debug(f"{self}: executing SETUP")
         self.value = self.init_value
 
-    def step(self):
-        time.sleep(0.5)
+    async def step(self):
+        # Yield to the loop, so registered methods are served meanwhile
+        await asyncio.sleep(0.5)
         self.value += 1
         return self.value
 
@@ -80,7 +80,7 @@ async def test_http_server_instanciate(http_server):
             json.dumps({"node_id": "1", "method_name": "a", "params": {}}),
         ),
         ("post", "/nodes/stop", json.dumps({})),
-        # ("post", "/packages/load", json.dumps({"packages": []})),
+        ("post", "/packages/load", json.dumps({"packages": []})),
         # ("post", "/shutdown", json.dumps({})),
     ],
 )